@@ -1,7 +1,15 @@
-from datetime import datetime, timedelta
+import asyncio
+import importlib.util
+import json
+import logging
+import re
+import sys
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import anthropic
+import httpx
 import rich_click as click
 from prompt_toolkit import PromptSession
 from prompt_toolkit.history import FileHistory
@@ -9,7 +17,7 @@ from rich.console import Console
 from rich.panel import Panel
 
 from .. import __version__
-from ..config import get_anthropic_api_key
+from ..config import get_anthropic_api_key, get_interpreter_model
 from ..utils import load_config
 from .chat import chat
 from .commands import CommandType, get_claude_system_prompt, parse_command, show_help
@@ -21,6 +29,28 @@ console = Console()
 CONFIG_FILE = Path.home() / ".wellcode" / "config.json"
 HISTORY_FILE = Path.home() / ".wellcode" / "command_history"
 
+# Keep the connection to the API open between turns, users usually take
+# longer than httpx's default 5 second keep-alive to type the next command
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60)
+
+# Commands are interpreted by a small model, answers that don't look like a
+# command are retried once with the larger fallback model
+INTERPRETER_MODEL = "claude-3-5-haiku-latest"
+FALLBACK_INTERPRETER_MODEL = "claude-3-5-sonnet-20240620"
+_COMMAND_RE = re.compile(r"^(review|report|config|chat|help|exit)(\s|$)")
+INTERPRET_PREFIX = "Convert this natural language request into a Wellcode CLI command: "
+BATCH_INTERPRET_PREFIX = (
+    "Convert each natural language request in this JSON array into a Wellcode "
+    "CLI command. Output ONLY a JSON array of strings where element i is the "
+    "command for request i: "
+)
+
+# Interpreted commands keyed by UTC day and whitespace-normalized input, the
+# day is part of the key because relative dates resolve differently each day.
+# Least recently used entries are dropped past INTERPRETATION_CACHE_SIZE
+INTERPRETATION_CACHE_SIZE = 512
+_interpretations = OrderedDict()
+
 
 @click.command()
 @click.pass_context
@@ -45,17 +75,174 @@ def chat_interface(ctx):
     # Initialize Anthropic client if configured
     client = None
     if get_anthropic_api_key():
-        client = anthropic.Client(api_key=get_anthropic_api_key())
+        client = anthropic.AsyncAnthropic(
+            api_key=get_anthropic_api_key(),
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                # HTTP/2 needs the optional h2 package
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=HTTP_LIMITS,
+                timeout=30.0,
+            ),
+        )
+
+    # Piped input is read up front so it can be interpreted in one request
+    if not sys.stdin.isatty():
+        commands = [line.strip() for line in sys.stdin if line.strip()]
+        asyncio.run(_run_batch(client, commands))
+        return
 
     # Initialize the prompt session
     session = PromptSession(history=FileHistory(str(HISTORY_FILE)))
 
+    asyncio.run(_repl(client, session))
+
+
+def _is_command(text: str) -> bool:
+    return _COMMAND_RE.match(text) is not None
+
+
+async def _stream_command(client, model: str, command: str) -> str:
+    """Stream the first line of Claude's interpretation of a request"""
+    chunks = []
+    console.print("[dim]Interpreting as: [/dim]", end="")
+    async with client.messages.stream(
+        model=model,
+        # Commands are a single short line
+        max_tokens=128,
+        messages=[
+            {
+                "role": "user",
+                "content": INTERPRET_PREFIX + command,
+            }
+        ],
+        system=get_claude_system_prompt(),
+    ) as stream:
+        async for text in stream.text_stream:
+            if not chunks:
+                text = text.lstrip()
+            line, newline, _ = text.partition("\n")
+            if line:
+                chunks.append(line)
+                console.print(line, end="", style="dim", markup=False, highlight=False)
+            # Stop generating once the command line is complete
+            if newline and chunks:
+                break
+        # Prompt usage arrives with message_start, so it's known even when
+        # generation is stopped early
+        usage = stream.current_message_snapshot.usage
+    console.print()
+
+    logging.debug(
+        "Interpreter prompt cache: %s tokens read, %s tokens written",
+        getattr(usage, "cache_read_input_tokens", None),
+        getattr(usage, "cache_creation_input_tokens", None),
+    )
+
+    return "".join(chunks).strip()
+
+
+async def _interpret(client, command: str) -> str:
+    """Use Claude to convert a natural language request into a CLI command"""
+    key = (datetime.now(timezone.utc).date(), " ".join(command.split()))
+
+    cached = _interpretations.get(key)
+    if cached is not None:
+        _interpretations.move_to_end(key)
+        console.print(
+            f"Interpreting as: {cached}", style="dim", markup=False, highlight=False
+        )
+        return cached
+
+    model = get_interpreter_model() or INTERPRETER_MODEL
+    interpreted = await _stream_command(client, model, command)
+    if not _is_command(interpreted) and model != FALLBACK_INTERPRETER_MODEL:
+        console.print("[dim]Not a Wellcode command, retrying with a larger model[/]")
+        interpreted = await _stream_command(client, FALLBACK_INTERPRETER_MODEL, command)
+
+    # Only remember answers that are commands, so a bad one is retried next time
+    if _is_command(interpreted):
+        _interpretations[key] = interpreted
+        if len(_interpretations) > INTERPRETATION_CACHE_SIZE:
+            _interpretations.popitem(last=False)
+    return interpreted
+
+
+async def _interpret_batch(client, model: str, commands: list) -> list:
+    """Use Claude to convert several requests into CLI commands in one call"""
+    response = await client.messages.create(
+        model=model,
+        max_tokens=128 * len(commands),
+        messages=[
+            {
+                "role": "user",
+                "content": BATCH_INTERPRET_PREFIX + json.dumps(commands),
+            }
+        ],
+        system=get_claude_system_prompt(),
+    )
+
+    text = response.content[0].text
+    # Ignore any code fence or prose around the array
+    interpreted = json.loads(text[text.find("[") : text.rfind("]") + 1])
+    if not isinstance(interpreted, list) or len(interpreted) != len(commands):
+        raise ValueError("Expected one command per request")
+    return [str(command).strip() for command in interpreted]
+
+
+async def _run_batch(client, commands: list):
+    """Interpret piped requests together and run them in order"""
+    pending = []
+    for command in commands:
+        if command.lower() in ["exit", "quit", "q"]:
+            break
+        pending.append(command)
+
+    to_interpret = [c for c in pending if c.lower() not in ["help", "?"]]
+    interpreted = {}
+    if client and to_interpret:
+        try:
+            model = get_interpreter_model() or INTERPRETER_MODEL
+            results = await _interpret_batch(client, model, to_interpret)
+            if not all(map(_is_command, results)) and (
+                model != FALLBACK_INTERPRETER_MODEL
+            ):
+                results = await _interpret_batch(
+                    client, FALLBACK_INTERPRETER_MODEL, to_interpret
+                )
+            interpreted = dict(zip(to_interpret, results))
+        except Exception as e:
+            console.print(f"[red]Error processing commands: {str(e)}[/]")
+    if client:
+        await client.close()
+
+    for command in pending:
+        if command.lower() in ["help", "?"]:
+            show_help()
+        elif not client:
+            # Basic command parsing without AI
+            execute_command(command)
+        elif interpreted.get(command):
+            console.print(
+                f"Interpreting as: {interpreted[command]}",
+                style="dim",
+                markup=False,
+                highlight=False,
+            )
+            execute_command(interpreted[command])
+        elif interpreted:
+            console.print(
+                f"[yellow]I couldn't understand '{command}'. Try rephrasing or type 'help' for suggestions.[/]"
+            )
+
+
+async def _repl(client, session):
+    """Read and run commands until the user exits"""
     while True:
         try:
             console.print(
                 "\n[bold cyan]What would you like to do?[/] (type 'help' for suggestions)"
             )
-            command = session.prompt("wellcode> ")
+            command = await session.prompt_async("wellcode> ")
 
             if command.lower() in ["exit", "quit", "q"]:
                 break
@@ -67,23 +254,7 @@ def chat_interface(ctx):
             if client:
                 # Use Claude to interpret the natural language command
                 try:
-                    response = client.messages.create(
-                        model="claude-3-sonnet-20240229",
-                        max_tokens=1024,
-                        messages=[
-                            {
-                                "role": "user",
-                                "content": f"Convert this natural language request into a Wellcode CLI command: {command}",
-                            }
-                        ],
-                        system=get_claude_system_prompt(),
-                    )
-
-                    interpreted_command = response.content[0].text.strip()
-                    console.print(
-                        f"Original command: '{command}' → Interpreted as: '{interpreted_command}'"
-                    )
-                    console.print(f"[dim]Interpreting as: {interpreted_command}[/dim]")
+                    interpreted_command = await _interpret(client, command)
 
                     if interpreted_command:
                         execute_command(interpreted_command)
@@ -101,77 +272,98 @@ def chat_interface(ctx):
         except Exception as e:
             console.print(f"[red]Error: {str(e)}[/]")
 
+    if client:
+        await client.close()
 
-def execute_command(command_str: str) -> bool:
-    """Execute a parsed command."""
-    try:
-        command_type, args, time_range = parse_command(command_str)
-        ctx = click.get_current_context()
 
-        if command_type == CommandType.REVIEW:
+def _parse_flags(args: list) -> dict:
+    """Map each --flag=value, --flag value or -f value in args to its value"""
+    flags = {}
+    it = iter(args)
+    for arg in it:
+        if arg.startswith("-"):
+            name, sep, value = arg.lstrip("-").partition("=")
+            flags[name] = value if sep else next(it, None)
+    return flags
 
-            parts = command_str.split()
 
-            date_args = {}
+def _do_review(ctx, command_str: str, args: list) -> bool:
+    flags = _parse_flags(command_str.split())
+    start = flags.get("start-date") or flags.get("s")
+    end = flags.get("end-date") or flags.get("e")
 
-            # Parse the command parts directly
-            for i in range(len(parts)):
-                if parts[i] == "--start-date" and i + 1 < len(parts):
-                    date_args["start-date"] = parts[i + 1]
-                elif parts[i] == "--end-date" and i + 1 < len(parts):
-                    date_args["end-date"] = parts[i + 1]
-                elif parts[i] == "--team" and i + 1 < len(parts):
-                    date_args["team"] = parts[i + 1]
-                elif parts[i] == "--user" and i + 1 < len(parts):
-                    date_args["user"] = parts[i + 1]
+    # Initialize dates
+    now = datetime.now()
 
-            # Initialize dates
-            now = datetime.now()
+    if start and end:
+        start_date = datetime.strptime(start, "%Y-%m-%d")
+        end_date = datetime.strptime(end, "%Y-%m-%d")
+    else:
+        # Default to last 7 days
+        end_date = now
+        start_date = end_date - timedelta(days=7)
 
-            if "start-date" in date_args and "end-date" in date_args:
-                start_date = datetime.strptime(date_args["start-date"], "%Y-%m-%d")
-                end_date = datetime.strptime(date_args["end-date"], "%Y-%m-%d")
-            else:
-                # Default to last 7 days
-                end_date = now
-                start_date = end_date - timedelta(days=7)
+    # Ensure proper time boundaries
+    end_date = end_date.replace(hour=23, minute=59, second=59)
+    start_date = start_date.replace(hour=0, minute=0, second=0)
 
-            # Ensure proper time boundaries
-            end_date = end_date.replace(hour=23, minute=59, second=59)
-            start_date = start_date.replace(hour=0, minute=0, second=0)
+    team = flags.get("team") or flags.get("t")
+    user = flags.get("user") or flags.get("u")
 
-            # Get team from args
-            team = date_args.get("team")
+    ctx.invoke(review, start_date=start_date, end_date=end_date, team=team, user=user)
+    return True
 
-            # get user from args
-            user = date_args.get("user")
 
-            ctx.invoke(
-                review, start_date=start_date, end_date=end_date, team=team, user=user
-            )
-        elif command_type == CommandType.CONFIG:
-            ctx.invoke(config)
-        elif command_type == CommandType.HELP:
-            show_help()
-        elif command_type == CommandType.CHAT:
-            initial_question = args[0] if args else None
-            console.print(f"Initial question: {initial_question}")
-            if (
-                not initial_question or initial_question.lower() == "chat"
-            ):  # If no question, enter interactive mode
-                ctx.invoke(chat)
-                return True  # Continue the main loop after chat exits
-            else:  # If there's a question, process it and return
-                ctx.invoke(chat, initial_question=initial_question)
-                return False  # Return to main prompt
-        elif command_type == CommandType.REPORT:
-            ctx.invoke(report)
-        else:
+def _do_config(ctx, command_str: str, args: list) -> bool:
+    ctx.invoke(config)
+    return True
+
+
+def _do_help(ctx, command_str: str, args: list) -> bool:
+    show_help()
+    return True
+
+
+def _do_chat(ctx, command_str: str, args: list) -> bool:
+    initial_question = args[0] if args else None
+    if (
+        not initial_question or initial_question.lower() == "chat"
+    ):  # If no question, enter interactive mode
+        ctx.invoke(chat)
+        return True  # Continue the main loop after chat exits
+    else:  # If there's a question, process it and return
+        ctx.invoke(chat, initial_question=initial_question)
+        return False  # Return to main prompt
+
+
+def _do_report(ctx, command_str: str, args: list) -> bool:
+    ctx.invoke(report)
+    return True
+
+
+# Handler for each command type, called with (ctx, command_str, args)
+COMMAND_HANDLERS = {
+    CommandType.REVIEW: _do_review,
+    CommandType.CONFIG: _do_config,
+    CommandType.HELP: _do_help,
+    CommandType.CHAT: _do_chat,
+    CommandType.REPORT: _do_report,
+}
+
+
+def execute_command(command_str: str) -> bool:
+    """Execute a parsed command."""
+    try:
+        command_type, args, time_range = parse_command(command_str)
+        ctx = click.get_current_context()
+
+        handler = COMMAND_HANDLERS.get(command_type)
+        if handler is None:
             console.print(
                 "[yellow]Invalid command. Type 'help' for available commands.[/]"
             )
             return False
-        return True
+        return handler(ctx, command_str, args)
 
     except Exception as e:
         console.print(f"[red]Error executing command: {str(e)}[/]")
@@ -1,12 +1,16 @@
+import re
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-import rich_click as click
 from rich.console import Console
 from rich.panel import Panel
 
+console = Console()
+
 
 class CommandType(Enum):
     REVIEW = "review"
@@ -69,14 +73,11 @@ COMMANDS = {
 }
 
 
-def get_claude_system_prompt():
-    today = datetime.now(timezone.utc)
-    yesterday = (today - timedelta(days=1)).strftime("%Y-%m-%d")
-    today = today.strftime("%Y-%m-%d")
-
-    return f"""You are a CLI command interpreter for the Wellcode engineering metrics tool. Convert natural language input into specific commands.
+# Static part of the interpreter prompt. Dates are referenced as <today>,
+# <yesterday> and <week_ago> so the text never changes and can be cached
+CLAUDE_SYSTEM_PROMPT = """You are a CLI command interpreter for the Wellcode engineering metrics tool. Convert natural language input into specific commands.
 
-Today's date is {today}.
+The current dates are given at the end of this prompt.
 
 Available Commands and Options:
 1. review
@@ -110,7 +111,7 @@ Available Commands and Options:
 Command Examples:
 - "review team performance" → "review --team frontend"
 - "show metrics for last week" → "review --start-date 2024-03-20 --end-date 2024-03-27"
-- "how was pimouss yesterday" → "review --user pimouss --start-date {yesterday} --end-date {today}"
+- "how was pimouss yesterday" → "review --user pimouss --start-date <yesterday> --end-date <today>"
 - "generate report" → "report --format html"
 - "save report to desktop" → "report --output ~/Desktop --format html"
 - "setup integrations" → "config"
@@ -177,8 +178,8 @@ Important:
 - Default to "help" if the intent is unclear
 
 Example Inputs and Outputs:
-- "how was pimouss yesterday" → "review --user pimouss --start-date {yesterday} --end-date {today}"
-- "show team frontend metrics for last week" → "review --team frontend --start-date {(datetime.now(timezone.utc) - timedelta(days=7)).strftime('%Y-%m-%d')} --end-date {today}"
+- "how was pimouss yesterday" → "review --user pimouss --start-date <yesterday> --end-date <today>"
+- "show team frontend metrics for last week" → "review --team frontend --start-date <week_ago> --end-date <today>"
 - "generate html report" → "report --format html"
 - "setup my workspace" → "config"
 - "let's chat about metrics" → "chat"
@@ -192,34 +193,35 @@ Example Inputs and Outputs:
 Remember: Use chat mode for analytical questions and review for direct metric queries."""
 
 
-def parse_time_range(command_str: str) -> Optional[TimeRange]:
-    """Parse temporal expressions from command string"""
-    now = datetime.now(timezone.utc)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-
-    if "yesterday" in command_str.lower():
-        end_date = today_start
-        start_date = end_date - timedelta(days=1)
-        return TimeRange(start_date, end_date)
-
-    if "last week" in command_str.lower():
-        end_date = today_start
-        start_date = end_date - timedelta(days=7)
-        return TimeRange(start_date, end_date)
-
-    if "this week" in command_str.lower():
-        end_date = today_start + timedelta(days=1)  # Include today
-        start_date = today_start - timedelta(days=today_start.weekday())
-        return TimeRange(start_date, end_date)
-
-    # Default to last 7 days if no temporal expression found
-    return None
-
-
-def parse_command(command_str: str) -> tuple[CommandType, list, Optional[TimeRange]]:
-    """Parse a command string into command type, arguments, and time range"""
-    # Single command mapping definition
-    cmd_mapping = {
+def get_claude_system_prompt():
+    """Return the interpreter system prompt as cacheable static and dated blocks"""
+    return _build_system_prompt(datetime.now(timezone.utc).date())
+
+
+@lru_cache(maxsize=2)
+def _build_system_prompt(day: date) -> list:
+    """Build the system prompt blocks once per UTC day"""
+    today = day.isoformat()
+    yesterday = (day - timedelta(days=1)).isoformat()
+    week_ago = (day - timedelta(days=7)).isoformat()
+
+    return [
+        {
+            "type": "text",
+            "text": CLAUDE_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"},
+        },
+        {
+            "type": "text",
+            "text": f"Today's date is {today}. <today> is {today}, "
+            f"<yesterday> is {yesterday} and <week_ago> is {week_ago}.",
+        },
+    ]
+
+
+# Keyword to command mapping used by parse_command, built once and read-only
+CMD_MAPPING: Mapping[str, CommandType] = MappingProxyType(
+    {
         "review": CommandType.REVIEW,
         "check": CommandType.REVIEW,
         "show": CommandType.REVIEW,
@@ -234,40 +236,86 @@ def parse_command(command_str: str) -> tuple[CommandType, list, Optional[TimeRan
         "quit": CommandType.EXIT,
         "q": CommandType.EXIT,
     }
+)
+
+# Matches any command keyword as a whole word, longest keywords first.
+# Lookarounds are used instead of \b so that "?" also matches.
+_CMD_RE = re.compile(
+    r"(?<!\w)("
+    + "|".join(map(re.escape, sorted(CMD_MAPPING, key=len, reverse=True)))
+    + r")(?!\w)"
+)
+
+
+_TIME_RE = re.compile(r"\b(yesterday|last week|this week)\b")
+
+
+def _yesterday(today_start: datetime) -> TimeRange:
+    return TimeRange(today_start - timedelta(days=1), today_start)
+
+
+def _last_week(today_start: datetime) -> TimeRange:
+    return TimeRange(today_start - timedelta(days=7), today_start)
+
+
+def _this_week(today_start: datetime) -> TimeRange:
+    start_date = today_start - timedelta(days=today_start.weekday())
+    return TimeRange(start_date, today_start + timedelta(days=1))  # Include today
+
+
+_TIME_RANGES = {
+    "yesterday": _yesterday,
+    "last week": _last_week,
+    "this week": _this_week,
+}
+
+
+def parse_time_range(
+    command_str: str, now: Optional[datetime] = None
+) -> Optional[TimeRange]:
+    """Parse temporal expressions from command string"""
+    match = _TIME_RE.search(command_str.lower())
+    if not match:
+        # Callers default to the last 7 days
+        return None
+
+    if now is None:
+        now = datetime.now(timezone.utc)
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return _TIME_RANGES[match.group(1)](today_start)
 
-    parts = command_str.strip().split()
-    time_range = parse_time_range(command_str)
+
+def parse_command(command_str: str) -> tuple[CommandType, list, Optional[TimeRange]]:
+    """Parse a command string into command type, arguments, and time range"""
+    lower_cmd = command_str.lower()
+    parts = command_str.split()
+    time_range = parse_time_range(lower_cmd)
 
     if not parts:
         return CommandType.CHAT, [command_str], time_range
 
     cmd = parts[0].lower()
-    args = parts[1:] if len(parts) > 1 else []
+    args = parts[1:]
 
     # Check for exact command match
-    if cmd in cmd_mapping:
-        return cmd_mapping[cmd], args, time_range
+    if cmd in CMD_MAPPING:
+        return CMD_MAPPING[cmd], args, time_range
 
     # Check if any command keyword is in the string
-    for key, value in cmd_mapping.items():
-        if key in command_str.lower():
-            if value == CommandType.REVIEW:
-                parts = command_str.lower().split(key)
-                if len(parts) > 1 and parts[1].strip():
-                    return value, [parts[1].strip().split()[0]], time_range
-            return value, [], time_range
+    match = _CMD_RE.search(lower_cmd)
+    if match:
+        command_type = CMD_MAPPING[match.group(1)]
+        if command_type == CommandType.REVIEW:
+            remainder = lower_cmd[match.end() :].split()
+            if remainder:
+                return command_type, [remainder[0]], time_range
+        return command_type, [], time_range
 
     # Default to chat with original input
     return CommandType.CHAT, [command_str], time_range
 
 
-def show_help():
-    """Show help information"""
-    console = Console()
-
-    console.print(
-        Panel(
-            """
+HELP_TEXT = """
 [bold cyan]Available Commands:[/]
 
 [bold]1. Review Performance[/]
@@ -317,51 +365,19 @@ def show_help():
 • If GitHub metrics are not showing, verify the GitHub App is installed correctly
 • For organizations with SAML SSO, ensure the GitHub App is authorized for your organization
 • For other integrations, check your API keys in the configuration
-""",
-            title="Wellcode.ai Help",
-            border_style="blue",
-        )
-    )
-
-
-console = Console()
-
-
-@click.command()
-@click.argument("shell", type=click.Choice(["bash", "zsh", "fish"]))
-def completion(shell):
-    """Generate shell completion script"""
-    completion_scripts = {
-        "bash": """
-# Wellcode CLI bash completion
-eval "$(_WELLCODE_CLI_COMPLETE=bash_source wellcode-cli)"
-""",
-        "zsh": """
-# Wellcode CLI zsh completion
-eval "$(_WELLCODE_CLI_COMPLETE=zsh_source wellcode-cli)"
-""",
-        "fish": """
-# Wellcode CLI fish completion
-eval (env _WELLCODE_CLI_COMPLETE=fish_source wellcode-cli)
-""",
-    }
-
-    console.print(
-        Panel(
-            f"""[bold green]Shell Completion Script for {shell}[/]
+"""
 
-To enable completion, add this to your shell configuration:
 
-[yellow]{completion_scripts[shell]}[/]
+@lru_cache(maxsize=1)
+def _help_panel() -> Panel:
+    """Parse the help markup once and reuse the panel"""
+    return Panel(
+        console.render_str(HELP_TEXT, highlight=False),
+        title="Wellcode.ai Help",
+        border_style="blue",
+    )
 
-[bold]Configuration File Locations:[/]
-• bash: ~/.bashrc
-• zsh:  ~/.zshrc
-• fish: ~/.config/fish/completions/wellcode-cli.fish
 
-[bold red]Note:[/] You'll need to restart your shell or source the config file after adding the script.
-""",
-            title=f"Wellcode.ai {shell.upper()} Completion",
-            border_style="blue",
-        )
-    )
+def show_help():
+    """Show help information"""
+    console.print(_help_panel())
@@ -1,18 +1,87 @@
-import statistics
+import json
+import os
+import threading
 import webbrowser
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-import plotly.graph_objects as go
-import plotly.io as pio
+import numpy as np
 import rich_click as click
 from rich.console import Console
 
 from ..utils import get_latest_analysis
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+CHART_BACKGROUND = "#F3F4F6"
+
+# Per-bar colors of the summary charts, shared by every report
+OVERVIEW_COLORS = ("#6366F1", "#EC4899", "#10B981", "#F59E0B")
+QUALITY_COLORS = ("#EF4444", "#F59E0B", "#6366F1", "#EC4899")
+COLLABORATION_COLORS = ("#3B82F6", "#EF4444", "#10B981", "#F59E0B")
+
+USER_ACTIVITY_METRICS = ("PRs Created", "PRs Merged", "Reviews Given", "Comments Given")
+REPO_ACTIVITY_METRICS = ("PRs Created", "PRs Merged", "Contributors", "Reviews")
+
+
+@lru_cache(maxsize=1)
+def _template():
+    """Default plotly template, which graph_objects figures would apply"""
+    import plotly.io as pio
+
+    return pio.templates[pio.templates.default].to_plotly_json()
+
+
+def _figure(data, title, xaxis_title=None, yaxis_title=None, **layout):
+    """Build a figure as a plain dict, skipping graph_objects validation"""
+    layout = {
+        "title": {"text": title},
+        "plot_bgcolor": CHART_BACKGROUND,
+        "paper_bgcolor": CHART_BACKGROUND,
+        "template": _template(),
+        **layout,
+    }
+    if xaxis_title:
+        layout.setdefault("xaxis", {})["title"] = {"text": xaxis_title}
+    if yaxis_title:
+        layout.setdefault("yaxis", {})["title"] = {"text": yaxis_title}
+    return {"data": data, "layout": layout}
+
+
+def _trace(trace_type, x, y, color=None, **trace):
+    trace = {"type": trace_type, "x": x, "y": y, **trace}
+    if color is not None:
+        trace["marker"] = {"color": color}
+    return trace
+
+
+def _histogram(values, color, name, bins=20):
+    """Bin values here and draw the bins as bars, so only the counts are embedded"""
+    counts, edges = np.histogram(np.asarray(values, dtype=np.float64), bins=bins)
+    return _trace(
+        "bar",
+        ((edges[:-1] + edges[1:]) / 2).tolist(),
+        counts.tolist(),
+        color=color,
+        name=name,
+        width=np.diff(edges).tolist(),
+    )
+
+
+def _open_report(url):
+    """Open the generated report in the default browser"""
+    try:
+        webbrowser.open(url)
+    except Exception as e:
+        console.print(f"[yellow]Could not open report automatically: {e}[/]")
+
 
 @click.command()
 @click.option(
@@ -44,218 +113,174 @@ def report(output, format):
         output_dir.mkdir(parents=True, exist_ok=True)
         console.print(f"Output directory: {output_dir}")
 
-        charts = []
+        charts = {}
         summary_stats = {}
 
         # GitHub Metrics Charts
         if github_data:
+            repositories = github_data.get("repositories", {})
+            users = github_data.get("users", {})
+            bottleneck_metrics = [
+                repo.get("bottleneck_metrics", {}) for repo in repositories.values()
+            ]
+
             # Organization Overview
             org_stats = {
-                "Total Repositories": len(github_data.get("repositories", {})),
+                "Total Repositories": len(repositories),
                 "Active Contributors": len(
                     set().union(
                         *[
                             set(repo.get("contributors", []))
-                            for repo in github_data.get("repositories", {}).values()
+                            for repo in repositories.values()
                         ]
                     )
                 ),
                 "Total PRs": sum(
-                    repo.get("prs_created", 0)
-                    for repo in github_data.get("repositories", {}).values()
+                    repo.get("prs_created", 0) for repo in repositories.values()
                 ),
                 "Merged PRs": sum(
-                    repo.get("prs_merged", 0)
-                    for repo in github_data.get("repositories", {}).values()
+                    repo.get("prs_merged", 0) for repo in repositories.values()
                 ),
             }
 
-            overview = go.Figure(
-                data=[
-                    go.Bar(
-                        x=list(org_stats.keys()),
-                        y=list(org_stats.values()),
-                        marker_color=["#6366F1", "#EC4899", "#10B981", "#F59E0B"],
-                    )
-                ]
-            )
-            overview.update_layout(
-                title="Organization Overview",
-                yaxis_title="Count",
-                plot_bgcolor="#F3F4F6",
-                paper_bgcolor="#F3F4F6",
-            )
-            charts.append(overview)
+            if any(org_stats.values()):
+                overview = _figure(
+                    [
+                        _trace(
+                            "bar",
+                            list(org_stats.keys()),
+                            list(org_stats.values()),
+                            color=OVERVIEW_COLORS,
+                        )
+                    ],
+                    "Organization Overview",
+                    yaxis_title="Count",
+                )
+                charts["overview"] = overview
 
             # Time Metrics
             time_metrics = []
-            for repo in github_data.get("repositories", {}).values():
+            for repo in repositories.values():
                 time_metrics.extend(
                     repo.get("time_metrics", {}).get("time_to_merge", [])
                 )
 
             if time_metrics:
-                merge_dist = go.Figure(
-                    data=[
-                        go.Histogram(
-                            x=time_metrics,
-                            nbinsx=20,
-                            name="Time to Merge Distribution",
-                            marker_color="#EC4899",
-                        )
-                    ]
-                )
-                merge_dist.update_layout(
-                    title="Time to Merge Distribution",
+                merge_dist = _figure(
+                    [_histogram(time_metrics, "#EC4899", "Time to Merge Distribution")],
+                    "Time to Merge Distribution",
                     xaxis_title="Hours",
                     yaxis_title="Frequency",
-                    plot_bgcolor="#F3F4F6",
-                    paper_bgcolor="#F3F4F6",
                 )
-                charts.append(merge_dist)
-
-            # User Activity
-            user_data = {}
-            for user in github_data.get("users", {}).values():
-                user_data[user.get("username", "")] = {
-                    "PRs Created": user.get("prs_created", 0),
-                    "PRs Merged": user.get("prs_merged", 0),
-                    "Reviews Given": user.get("review_metrics", {}).get(
-                        "reviews_performed", 0
-                    ),
-                    "Comments Given": user.get("review_metrics", {}).get(
-                        "review_comments_given", 0
-                    ),
-                }
-
-            if user_data:
-                user_activity = go.Figure()
-                for metric in [
-                    "PRs Created",
-                    "PRs Merged",
-                    "Reviews Given",
-                    "Comments Given",
-                ]:
-                    user_activity.add_trace(
-                        go.Bar(
-                            name=metric,
-                            x=list(user_data.keys()),
-                            y=[user_data[user][metric] for user in user_data],
-                        )
-                    )
-
-                user_activity.update_layout(
-                    title="User Activity",
-                    barmode="group",
+                charts["merge_time"] = merge_dist
+
+            # User Activity, one row per user transposed into one series
+            # per metric
+            user_rows = [
+                (
+                    user.get("username", ""),
+                    user.get("prs_created", 0),
+                    user.get("prs_merged", 0),
+                    user.get("review_metrics", {}).get("reviews_performed", 0),
+                    user.get("review_metrics", {}).get("review_comments_given", 0),
+                )
+                for user in users.values()
+            ]
+
+            if user_rows:
+                user_names, *user_series = zip(*user_rows)
+                user_activity = _figure(
+                    [
+                        _trace("bar", list(user_names), list(values), name=metric)
+                        for metric, values in zip(USER_ACTIVITY_METRICS, user_series)
+                    ],
+                    "User Activity",
                     xaxis_title="Users",
                     yaxis_title="Count",
-                    plot_bgcolor="#F3F4F6",
-                    paper_bgcolor="#F3F4F6",
+                    barmode="group",
                 )
-                charts.append(user_activity)
+                charts["user_activity"] = user_activity
 
             # Repository Metrics
-            repo_metrics = {}
-            for repo_name, repo in github_data.get("repositories", {}).items():
-                repo_metrics[repo_name] = {
-                    "PRs Created": repo.get("prs_created", 0),
-                    "PRs Merged": repo.get("prs_merged", 0),
-                    "Contributors": len(repo.get("contributors", [])),
-                    "Reviews": repo.get("review_metrics", {}).get(
-                        "reviews_performed", 0
-                    ),
-                }
-
-            if repo_metrics:
-                repo_activity = go.Figure()
-                for metric in ["PRs Created", "PRs Merged", "Contributors", "Reviews"]:
-                    repo_activity.add_trace(
-                        go.Bar(
-                            name=metric,
-                            x=list(repo_metrics.keys()),
-                            y=[repo_metrics[repo][metric] for repo in repo_metrics],
-                        )
-                    )
-
-                repo_activity.update_layout(
-                    title="Repository Activity",
-                    barmode="group",
+            repo_rows = [
+                (
+                    repo_name,
+                    repo.get("prs_created", 0),
+                    repo.get("prs_merged", 0),
+                    len(repo.get("contributors", [])),
+                    repo.get("review_metrics", {}).get("reviews_performed", 0),
+                )
+                for repo_name, repo in repositories.items()
+            ]
+
+            if repo_rows:
+                repo_names, *repo_series = zip(*repo_rows)
+                repo_activity = _figure(
+                    [
+                        _trace("bar", list(repo_names), list(values), name=metric)
+                        for metric, values in zip(REPO_ACTIVITY_METRICS, repo_series)
+                    ],
+                    "Repository Activity",
                     xaxis_title="Repositories",
                     yaxis_title="Count",
-                    plot_bgcolor="#F3F4F6",
-                    paper_bgcolor="#F3F4F6",
+                    barmode="group",
                 )
-                charts.append(repo_activity)
+                charts["repo_activity"] = repo_activity
 
             # Code Quality Metrics
             code_metrics = {
                 "Hotfixes": sum(
                     repo.get("code_metrics", {}).get("hotfixes", 0)
-                    for repo in github_data.get("repositories", {}).values()
+                    for repo in repositories.values()
                 ),
                 "Reverts": sum(
                     repo.get("code_metrics", {}).get("reverts", 0)
-                    for repo in github_data.get("repositories", {}).values()
+                    for repo in repositories.values()
                 ),
                 "Blocking Reviews": sum(
                     user.get("review_metrics", {}).get("blocking_reviews_given", 0)
-                    for user in github_data.get("users", {}).values()
-                ),
-                "Stale PRs": sum(
-                    repo.get("bottleneck_metrics", {}).get("stale_prs", 0)
-                    for repo in github_data.get("repositories", {}).values()
+                    for user in users.values()
                 ),
+                "Stale PRs": sum(b.get("stale_prs", 0) for b in bottleneck_metrics),
             }
 
-            quality = go.Figure(
-                data=[
-                    go.Bar(
-                        x=list(code_metrics.keys()),
-                        y=list(code_metrics.values()),
-                        marker_color=["#EF4444", "#F59E0B", "#6366F1", "#EC4899"],
-                    )
-                ]
-            )
-            quality.update_layout(
-                title="Code Quality Metrics",
-                yaxis_title="Count",
-                plot_bgcolor="#F3F4F6",
-                paper_bgcolor="#F3F4F6",
-            )
-            charts.append(quality)
+            # An all-zero chart carries no information, so it is left out
+            if any(code_metrics.values()):
+                quality = _figure(
+                    [
+                        _trace(
+                            "bar",
+                            list(code_metrics.keys()),
+                            list(code_metrics.values()),
+                            color=QUALITY_COLORS,
+                        )
+                    ],
+                    "Code Quality Metrics",
+                    yaxis_title="Count",
+                )
+                charts["quality"] = quality
 
             # Add new charts for engineering managers
 
             # 1. PR Review Time Distribution
             review_times = []
-            for repo in github_data.get("repositories", {}).values():
+            for repo in repositories.values():
                 review_times.extend(
                     repo.get("review_metrics", {}).get("review_wait_times", [])
                 )
 
             if review_times:
-                review_dist = go.Figure(
-                    data=[
-                        go.Histogram(
-                            x=review_times,
-                            nbinsx=20,
-                            name="Review Time Distribution",
-                            marker_color="#8B5CF6",
-                        )
-                    ]
-                )
-                review_dist.update_layout(
-                    title="PR Review Time Distribution",
+                review_dist = _figure(
+                    [_histogram(review_times, "#8B5CF6", "Review Time Distribution")],
+                    "PR Review Time Distribution",
                     xaxis_title="Hours",
                     yaxis_title="Frequency",
-                    plot_bgcolor="#F3F4F6",
-                    paper_bgcolor="#F3F4F6",
                 )
-                charts.append(review_dist)
+                charts["review_time"] = review_dist
 
             # 2. Team Collaboration Metrics
             team_metrics = {}
-            for repo in github_data.get("repositories", {}).values():
+            for repo in repositories.values():
                 collab_metrics = repo.get("collaboration_metrics", {})
                 team_metrics["Cross-team Reviews"] = team_metrics.get(
                     "Cross-team Reviews", 0
@@ -270,23 +295,20 @@ def report(output, format):
                     "External Reviews", 0
                 ) + collab_metrics.get("external_reviews", 0)
 
-            if team_metrics:
-                collaboration = go.Figure(
-                    data=[
-                        go.Bar(
-                            x=list(team_metrics.keys()),
-                            y=list(team_metrics.values()),
-                            marker_color=["#3B82F6", "#EF4444", "#10B981", "#F59E0B"],
+            if any(team_metrics.values()):
+                collaboration = _figure(
+                    [
+                        _trace(
+                            "bar",
+                            list(team_metrics.keys()),
+                            list(team_metrics.values()),
+                            color=COLLABORATION_COLORS,
                         )
-                    ]
-                )
-                collaboration.update_layout(
-                    title="Team Collaboration Overview",
+                    ],
+                    "Team Collaboration Overview",
                     yaxis_title="Count",
-                    plot_bgcolor="#F3F4F6",
-                    paper_bgcolor="#F3F4F6",
                 )
-                charts.append(collaboration)
+                charts["collaboration"] = collaboration
 
             # 3. Bottleneck Analysis
             bottleneck_data = {
@@ -297,51 +319,36 @@ def report(output, format):
                     "High Review Wait Time",
                 ],
                 "Values": [
+                    code_metrics["Stale PRs"],
+                    sum(b.get("long_running_prs", 0) for b in bottleneck_metrics),
+                    sum(b.get("blocked_prs", 0) for b in bottleneck_metrics),
+                    # PRs waiting > 48 hours for review
                     sum(
-                        repo.get("bottleneck_metrics", {}).get("stale_prs", 0)
-                        for repo in github_data.get("repositories", {}).values()
-                    ),
-                    sum(
-                        repo.get("bottleneck_metrics", {}).get("long_running_prs", 0)
-                        for repo in github_data.get("repositories", {}).values()
+                        t > 48
+                        for b in bottleneck_metrics
+                        for t in b.get("review_wait_times", [])
                     ),
-                    sum(
-                        repo.get("bottleneck_metrics", {}).get("blocked_prs", 0)
-                        for repo in github_data.get("repositories", {}).values()
-                    ),
-                    len(
-                        [
-                            t
-                            for repo in github_data.get("repositories", {}).values()
-                            for t in repo.get("bottleneck_metrics", {}).get(
-                                "review_wait_times", []
-                            )
-                            if t > 48
-                        ]
-                    ),  # PRs waiting > 48 hours for review
                 ],
             }
 
-            bottlenecks = go.Figure(
-                data=[
-                    go.Bar(
-                        x=bottleneck_data["Metrics"],
-                        y=bottleneck_data["Values"],
-                        marker_color="#EF4444",
-                    )
-                ]
-            )
-            bottlenecks.update_layout(
-                title="Development Bottlenecks",
-                yaxis_title="Count",
-                plot_bgcolor="#F3F4F6",
-                paper_bgcolor="#F3F4F6",
-            )
-            charts.append(bottlenecks)
+            if any(bottleneck_data["Values"]):
+                bottlenecks = _figure(
+                    [
+                        _trace(
+                            "bar",
+                            bottleneck_data["Metrics"],
+                            bottleneck_data["Values"],
+                            color="#EF4444",
+                        )
+                    ],
+                    "Development Bottlenecks",
+                    yaxis_title="Count",
+                )
+                charts["bottlenecks"] = bottlenecks
 
             # 4. Team Velocity Trends
             velocity_data = {}
-            for repo in github_data.get("repositories", {}).values():
+            for repo in repositories.values():
                 for pr in repo.get("time_metrics", {}).get("lead_times", []):
                     week = datetime.fromtimestamp(pr * 3600).strftime(
                         "%Y-%W"
@@ -350,28 +357,25 @@ def report(output, format):
 
             if velocity_data:
                 weeks = sorted(velocity_data.keys())
-                velocity = go.Figure(
-                    data=[
-                        go.Scatter(
-                            x=weeks,
-                            y=[velocity_data[week] for week in weeks],
+                velocity = _figure(
+                    [
+                        _trace(
+                            "scatter",
+                            weeks,
+                            [velocity_data[week] for week in weeks],
                             mode="lines+markers",
-                            line=dict(color="#10B981"),
+                            line={"color": "#10B981"},
                         )
-                    ]
-                )
-                velocity.update_layout(
-                    title="Team Velocity (PRs Merged per Week)",
+                    ],
+                    "Team Velocity (PRs Merged per Week)",
                     xaxis_title="Week",
                     yaxis_title="PRs Merged",
-                    plot_bgcolor="#F3F4F6",
-                    paper_bgcolor="#F3F4F6",
                 )
-                charts.append(velocity)
+                charts["velocity"] = velocity
 
             # 5. Code Review Participation
             reviewer_stats = defaultdict(int)
-            for repo in github_data.get("repositories", {}).values():
+            for repo in repositories.values():
                 for reviewer_data in (
                     repo.get("review_metrics", {}).get("reviewers_per_pr", {}).values()
                 ):
@@ -379,34 +383,33 @@ def report(output, format):
                         reviewer_stats[reviewer] += 1
 
             if reviewer_stats:
-                reviewers = go.Figure(
-                    data=[
-                        go.Bar(
-                            x=list(reviewer_stats.keys()),
-                            y=list(reviewer_stats.values()),
-                            marker_color="#6366F1",
+                reviewers = _figure(
+                    [
+                        _trace(
+                            "bar",
+                            list(reviewer_stats.keys()),
+                            list(reviewer_stats.values()),
+                            color="#6366F1",
                         )
-                    ]
-                )
-                reviewers.update_layout(
-                    title="Code Review Participation by Team Member",
+                    ],
+                    "Code Review Participation by Team Member",
                     xaxis_title="Team Member",
                     yaxis_title="Reviews Performed",
-                    plot_bgcolor="#F3F4F6",
-                    paper_bgcolor="#F3F4F6",
                 )
-                charts.append(reviewers)
+                charts["reviewers"] = reviewers
 
             # 6. PRs per Developer
             developer_prs = {}
-            for username, user in github_data.get("users", {}).items():
+            for username, user in users.items():
                 if username.endswith("[bot]"):  # Skip bot users
                     continue
 
                 # Safely calculate average review time
                 time_to_merge = user.get("time_metrics", {}).get("time_to_merge", [])
                 avg_review_time = (
-                    round(statistics.mean(time_to_merge)) if time_to_merge else 0
+                    round(sum(time_to_merge) / len(time_to_merge))
+                    if time_to_merge
+                    else 0
                 )
 
                 developer_prs[username] = {
@@ -421,97 +424,80 @@ def report(output, format):
 
             if developer_prs:
                 # PR Creation and Merge Rate
-                pr_activity = go.Figure()
+                developers = list(developer_prs.keys())
 
                 # Add traces for Created, Merged, and Open PRs
-                pr_activity.add_trace(
-                    go.Bar(
-                        name="Created PRs",
-                        x=list(developer_prs.keys()),
-                        y=[data["Created"] for data in developer_prs.values()],
-                        marker_color="#3B82F6",
-                    )
-                )
-
-                pr_activity.add_trace(
-                    go.Bar(
-                        name="Merged PRs",
-                        x=list(developer_prs.keys()),
-                        y=[data["Merged"] for data in developer_prs.values()],
-                        marker_color="#10B981",
-                    )
-                )
-
-                pr_activity.add_trace(
-                    go.Bar(
-                        name="Open PRs",
-                        x=list(developer_prs.keys()),
-                        y=[data["Open"] for data in developer_prs.values()],
-                        marker_color="#F59E0B",
-                    )
-                )
-
-                pr_activity.update_layout(
-                    title="PR Activity by Developer",
-                    barmode="group",
+                pr_activity = _figure(
+                    [
+                        _trace(
+                            "bar",
+                            developers,
+                            [data[key] for data in developer_prs.values()],
+                            color=color,
+                            name=f"{key} PRs",
+                        )
+                        for key, color in [
+                            ("Created", "#3B82F6"),
+                            ("Merged", "#10B981"),
+                            ("Open", "#F59E0B"),
+                        ]
+                    ],
+                    "PR Activity by Developer",
                     xaxis_title="Developer",
                     yaxis_title="Number of PRs",
-                    plot_bgcolor="#F3F4F6",
-                    paper_bgcolor="#F3F4F6",
+                    barmode="group",
                     showlegend=True,
                 )
-                charts.append(pr_activity)
+                charts["pr_activity"] = pr_activity
 
                 # PR Size and Review Time (only if we have data)
                 if any(
                     data["Avg Size"] > 0 or data["Avg Review Time"] > 0
                     for data in developer_prs.values()
                 ):
-                    pr_metrics = go.Figure()
-
-                    pr_metrics.add_trace(
-                        go.Bar(
-                            name="Avg PR Size (changes)",
-                            x=list(developer_prs.keys()),
-                            y=[data["Avg Size"] for data in developer_prs.values()],
-                            marker_color="#8B5CF6",
-                            yaxis="y",
-                        )
-                    )
-
-                    pr_metrics.add_trace(
-                        go.Scatter(
-                            name="Avg Review Time (hours)",
-                            x=list(developer_prs.keys()),
-                            y=[
-                                data["Avg Review Time"]
-                                for data in developer_prs.values()
-                            ],
-                            marker_color="#EC4899",
-                            yaxis="y2",
-                        )
-                    )
-
-                    pr_metrics.update_layout(
-                        title="PR Metrics by Developer",
+                    pr_metrics = _figure(
+                        [
+                            _trace(
+                                "bar",
+                                developers,
+                                [data["Avg Size"] for data in developer_prs.values()],
+                                color="#8B5CF6",
+                                name="Avg PR Size (changes)",
+                                yaxis="y",
+                            ),
+                            _trace(
+                                "scatter",
+                                developers,
+                                [
+                                    data["Avg Review Time"]
+                                    for data in developer_prs.values()
+                                ],
+                                color="#EC4899",
+                                name="Avg Review Time (hours)",
+                                yaxis="y2",
+                            ),
+                        ],
+                        "PR Metrics by Developer",
                         xaxis_title="Developer",
-                        yaxis=dict(
-                            title="Average PR Size",
-                            titlefont=dict(color="#8B5CF6"),
-                            tickfont=dict(color="#8B5CF6"),
-                        ),
-                        yaxis2=dict(
-                            title="Average Review Time (hours)",
-                            titlefont=dict(color="#EC4899"),
-                            tickfont=dict(color="#EC4899"),
-                            overlaying="y",
-                            side="right",
-                        ),
-                        plot_bgcolor="#F3F4F6",
-                        paper_bgcolor="#F3F4F6",
+                        yaxis={
+                            "title": {
+                                "text": "Average PR Size",
+                                "font": {"color": "#8B5CF6"},
+                            },
+                            "tickfont": {"color": "#8B5CF6"},
+                        },
+                        yaxis2={
+                            "title": {
+                                "text": "Average Review Time (hours)",
+                                "font": {"color": "#EC4899"},
+                            },
+                            "tickfont": {"color": "#EC4899"},
+                            "overlaying": "y",
+                            "side": "right",
+                        },
                         showlegend=True,
                     )
-                    charts.append(pr_metrics)
+                    charts["pr_metrics"] = pr_metrics
 
                 # Update summary stats with developer PR metrics
                 if developer_prs:
@@ -560,17 +546,25 @@ def report(output, format):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             report_file = output_dir / f"engineering_report_{timestamp}.html"
 
-            html_content = generate_html_content(charts)
-
-            with open(report_file, "w") as f:
-                f.write(html_content)
+            # Write each chart as it is rendered instead of building one string.
+            # The report is written to a temporary file and moved into place
+            # once complete, so a failure doesn't leave a partial report
+            temp_file = report_file.with_name(f".{report_file.name}.tmp")
+            try:
+                with open(temp_file, "w", buffering=1 << 20) as f:
+                    f.writelines(generate_html_content(charts))
+                os.replace(temp_file, report_file)
+            except BaseException:
+                temp_file.unlink(missing_ok=True)
+                raise
 
             console.print(f"\n[bold green]Report generated: {report_file}[/]")
 
-            try:
-                webbrowser.open(f"file://{report_file}")
-            except Exception as e:
-                console.print(f"[yellow]Could not open report automatically: {e}[/]")
+            # Launching the browser can take a moment, so don't hold up the
+            # command for it
+            threading.Thread(
+                target=_open_report, args=(f"file://{report_file}",)
+            ).start()
 
             return report_file
         else:
@@ -582,61 +576,59 @@ def report(output, format):
         raise
 
 
-def generate_html_content(charts):
-    """Generate HTML content with all charts and explanations"""
-    html_template = """
+HTML_HEADER = """
     <!DOCTYPE html>
     <html>
         <head>
             <title>Wellcode Engineering Metrics Report</title>
             <style>
-                body {{
+                body {
                     font-family: Arial, sans-serif;
                     margin: 20px;
                     background-color: #f5f5f5;
                     max-width: 1200px;
                     margin: 0 auto;
                     padding: 20px;
-                }}
-                .header {{
+                }
+                .header {
                     text-align: center;
                     padding: 40px 0;
                     background: linear-gradient(135deg, #4F46E5, #7C3AED);
                     color: white;
                     border-radius: 8px;
                     margin-bottom: 40px;
-                }}
-                .header h1 {{
+                }
+                .header h1 {
                     margin: 0;
                     font-size: 2.5em;
-                }}
-                .header p {{
+                }
+                .header p {
                     margin: 10px 0 0;
                     opacity: 0.9;
-                }}
-                .chart-container {{
+                }
+                .chart-container {
                     background-color: white;
                     padding: 30px;
                     margin: 30px 0;
                     border-radius: 8px;
                     box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }}
-                .chart-description {{
+                }
+                .chart-description {
                     color: #4B5563;
                     margin: 20px 0;
                     line-height: 1.6;
-                }}
-                .section-title {{
+                }
+                .section-title {
                     color: #1F2937;
                     margin-top: 40px;
                     padding-bottom: 10px;
                     border-bottom: 2px solid #E5E7EB;
-                }}
-                .timestamp {{
+                }
+                .timestamp {
                     text-align: center;
                     color: #6B7280;
                     margin-top: 40px;
-                }}
+                }
             </style>
         </head>
         <body>
@@ -646,76 +638,19 @@ def generate_html_content(charts):
             </div>
 
             <div class="charts">
-                <h2 class="section-title">Organization Overview</h2>
-                <div class="chart-container">
-                    <div class="chart-description">
-                        This chart provides a high-level view of your organization's GitHub activity,
-                        showing the total number of repositories, active contributors, and PR metrics.
-                        It helps identify the overall scale of your engineering operations.
-                    </div>
-                    {charts[0]}
-                </div>
-
-                <h2 class="section-title">Time and Efficiency Metrics</h2>
-                <div class="chart-container">
-                    <div class="chart-description">
-                        The Time to Merge distribution shows how quickly PRs move through your review process.
-                        A left-skewed distribution indicates efficient PR processing, while long tails might
-                        suggest bottlenecks in your review process.
-                    </div>
-                    {charts[1]}
-                </div>
-
-                <h2 class="section-title">Team Activity Analysis</h2>
-                <div class="chart-container">
-                    <div class="chart-description">
-                        This visualization breaks down individual contributions across different metrics,
-                        helping identify team members' strengths and participation patterns in the
-                        development process.
-                    </div>
-                    {charts[2]}
-                </div>
-
-                <h2 class="section-title">Repository Performance</h2>
-                <div class="chart-container">
-                    <div class="chart-description">
-                        Compare activity levels across different repositories to understand where most
-                        development is happening and identify potential areas needing more attention
-                        or support.
-                    </div>
-                    {charts[3]}
-                </div>
+"""
 
-                <h2 class="section-title">Code Quality Indicators</h2>
+HTML_SECTION = """                <h2 class="section-title">{title}</h2>
                 <div class="chart-container">
                     <div class="chart-description">
-                        Track key quality metrics including hotfixes, reverts, and blocking reviews.
-                        These indicators help identify potential areas for process improvement and
-                        where additional code review attention might be needed.
+                        {description}
                     </div>
-                    {charts[4]}
+                    {chart}
                 </div>
 
-                <h2 class="section-title">Review Process Analysis</h2>
-                <div class="chart-container">
-                    <div class="chart-description">
-                        The PR Review Time Distribution shows how long PRs typically wait for review.
-                        This helps identify if your review process is running smoothly or if there are
-                        delays that need addressing.
-                    </div>
-                    {charts[5]}
-                </div>
+"""
 
-                <h2 class="section-title">Team Collaboration Patterns</h2>
-                <div class="chart-container">
-                    <div class="chart-description">
-                        Understand how your team collaborates through different types of reviews.
-                        High cross-team review numbers indicate good knowledge sharing, while high
-                        self-merges might suggest areas for process improvement.
-                    </div>
-                    {charts[6]}
-                </div>
-            </div>
+HTML_FOOTER = """            </div>
 
             <div class="timestamp">
                 Generated on {timestamp}
@@ -724,9 +659,103 @@ def generate_html_content(charts):
     </html>
     """
 
-    timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-    charts_html = []
-    for chart in charts:
-        charts_html.append(pio.to_html(chart, full_html=False))
+# Report sections in display order, keyed by the chart each one shows
+REPORT_SECTIONS = [
+    (
+        "overview",
+        "Organization Overview",
+        "This chart provides a high-level view of your organization's GitHub "
+        "activity, showing the total number of repositories, active contributors, and "
+        "PR metrics. It helps identify the overall scale of your engineering "
+        "operations.",
+    ),
+    (
+        "merge_time",
+        "Time and Efficiency Metrics",
+        "The Time to Merge distribution shows how quickly PRs move through your "
+        "review process. A left-skewed distribution indicates efficient PR "
+        "processing, while long tails might suggest bottlenecks in your review "
+        "process.",
+    ),
+    (
+        "user_activity",
+        "Team Activity Analysis",
+        "This visualization breaks down individual contributions across different "
+        "metrics, helping identify team members' strengths and participation patterns "
+        "in the development process.",
+    ),
+    (
+        "repo_activity",
+        "Repository Performance",
+        "Compare activity levels across different repositories to understand where "
+        "most development is happening and identify potential areas needing more "
+        "attention or support.",
+    ),
+    (
+        "quality",
+        "Code Quality Indicators",
+        "Track key quality metrics including hotfixes, reverts, and blocking reviews. "
+        "These indicators help identify potential areas for process improvement and "
+        "where additional code review attention might be needed.",
+    ),
+    (
+        "review_time",
+        "Review Process Analysis",
+        "The PR Review Time Distribution shows how long PRs typically wait for "
+        "review. This helps identify if your review process is running smoothly or if "
+        "there are delays that need addressing.",
+    ),
+    (
+        "collaboration",
+        "Team Collaboration Patterns",
+        "Understand how your team collaborates through different types of reviews. "
+        "High cross-team review numbers indicate good knowledge sharing, while high "
+        "self-merges might suggest areas for process improvement.",
+    ),
+]
+
+
+def _to_json(obj):
+    """Serialize chart data for an inline script, using orjson when available"""
+    if orjson is not None:
+        content = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    else:
+        content = json.dumps(obj, separators=(",", ":"))
+    # Keep chart text from closing the surrounding <script> tag
+    return content.replace("</", "<\\/")
+
+
+def _chart_html(chart_id, chart):
+    """Render a dict figure as a div and the Plotly.newPlot call that fills it"""
+    return (
+        f'<div id="{chart_id}" class="plotly-graph-div" '
+        'style="height:100%; width:100%;"></div>\n'
+        '<script type="text/javascript">'
+        f'Plotly.newPlot("{chart_id}", {_to_json(chart["data"])}, '
+        f'{_to_json(chart.get("layout", {}))}, {{"responsive": true}});'
+        "</script>"
+    )
 
-    return html_template.format(charts=charts_html, timestamp=timestamp)
+
+def generate_html_content(charts):
+    """Yield the report HTML piece by piece, with each chart and its explanation"""
+    # plotly is slow to import, so it is only loaded when a report is written
+    from plotly.offline import get_plotlyjs
+
+    yield HTML_HEADER
+    # plotly.js is inlined once so the report still works offline
+    yield f'<script type="text/javascript">{get_plotlyjs()}</script>\n'
+    for key, title, description in REPORT_SECTIONS:
+        # Charts without data were never built, so their sections are left out
+        chart = charts.get(key)
+        if chart is None:
+            continue
+        # Charts are plain dicts built by _figure, so they are serialized
+        # directly instead of going through pio.to_html
+        chart_html = _chart_html(f"chart-{key}", chart)
+        yield HTML_SECTION.format(
+            title=title, description=description, chart=chart_html
+        )
+
+    timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
+    yield HTML_FOOTER.format(timestamp=timestamp)
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -16,7 +17,7 @@ from ..config import (
 from ..github.app_config import WELLCODE_APP
 from ..github.client import GithubClient
 from ..github.github_display import display_github_metrics
-from ..github.github_format_ai import format_ai_response, get_ai_analysis
+from ..github.github_format_ai import get_ai_analysis
 from ..github.github_metrics import get_github_metrics
 from ..linear.linear_display import display_linear_metrics
 from ..linear.linear_metrics import get_linear_metrics
@@ -98,44 +99,60 @@ def review(start_date, end_date, user, team):
     analysis_result = None
 
     with console.status("[bold green]Fetching metrics...") as status:
-        # GitHub metrics
-        status.update("Fetching GitHub metrics...")
-        metrics = get_github_metrics(entity_name, start_date, end_date, user, team)
-
-        if metrics:
-            all_metrics["github"] = metrics
-            display_github_metrics(metrics)
-        else:
-            if mode == "organization":
-                console.print("[yellow]⚠️  GitHub App not installed[/]")
-                console.print(f"Please install the app at: {WELLCODE_APP['APP_URL']}")
+        # Linear and Split.io are fetched in the background while GitHub
+        # metrics are collected. The collectors don't print; their results,
+        # including any errors, are displayed in order from this thread
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            linear_future = (
+                executor.submit(get_linear_metrics, start_date, end_date, user)
+                if get_linear_api_key()
+                else None
+            )
+            split_future = (
+                executor.submit(get_split_metrics, start_date, end_date)
+                if get_split_api_key()
+                else None
+            )
+
+            # GitHub metrics
+            status.update("Fetching GitHub metrics...")
+            metrics = get_github_metrics(entity_name, start_date, end_date, user, team)
+
+            if metrics:
+                all_metrics["github"] = metrics
+                display_github_metrics(metrics)
             else:
-                console.print("[red]Error: Failed to fetch GitHub metrics[/]")
-
-        # Linear metrics
-        if get_linear_api_key():
-            status.update("Fetching Linear metrics...")
-            linear_metrics = get_linear_metrics(start_date, end_date, user)
-            all_metrics["linear"] = linear_metrics
-            display_linear_metrics(linear_metrics)
-        else:
-            console.print("[yellow]⚠️  Linear integration not configured[/]")
-
-        # Split metrics
-        if get_split_api_key():
-            status.update("Fetching Split metrics...")
-            split_metrics = get_split_metrics(start_date, end_date)
-            all_metrics["split"] = split_metrics
-            display_split_metrics(split_metrics)
-        else:
-            console.print("[yellow]⚠️  Split.io integration not configured[/]")
+                if mode == "organization":
+                    console.print("[yellow]⚠️  GitHub App not installed[/]")
+                    console.print(
+                        f"Please install the app at: {WELLCODE_APP['APP_URL']}"
+                    )
+                else:
+                    console.print("[red]Error: Failed to fetch GitHub metrics[/]")
+
+            # Linear metrics
+            if linear_future:
+                status.update("Fetching Linear metrics...")
+                linear_metrics = linear_future.result()
+                all_metrics["linear"] = linear_metrics
+                display_linear_metrics(linear_metrics)
+            else:
+                console.print("[yellow]⚠️  Linear integration not configured[/]")
+
+            # Split metrics
+            if split_future:
+                status.update("Fetching Split metrics...")
+                split_metrics = split_future.result()
+                all_metrics["split"] = split_metrics
+                display_split_metrics(split_metrics)
+            else:
+                console.print("[yellow]⚠️  Split.io integration not configured[/]")
 
         # AI Analysis
         if get_anthropic_api_key():
             try:
                 status.update("Generating AI analysis...")
-                analysis_result = get_ai_analysis(all_metrics)
-                format_ai_response(analysis_result)
+                analysis_result = get_ai_analysis(all_metrics, render=True)
             except InternalServerError as e:
                 if "overloaded_error" in str(e):
                     console.print(
@@ -46,3 +46,7 @@ def get_anthropic_api_key() -> Optional[str]:
 
 def get_split_api_key() -> Optional[str]:
     return get_config_value("SPLIT_API_KEY")
+
+
+def get_interpreter_model() -> Optional[str]:
+    return get_config_value("CLAUDE_INTERPRETER_MODEL")
@@ -1,14 +1,17 @@
-import statistics
 from datetime import datetime, timezone
 
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-
 from wellcode_cli.utils import load_config
 
 
+def _mean(values) -> float:
+    """Mean of a list of numbers, 0 when it is empty"""
+    return sum(values) / len(values) if values else 0
+
+
 def display_github_metrics(metrics):
     """Display GitHub metrics with a modern UI using Rich components."""
     console = Console()
@@ -108,11 +111,7 @@ def display_github_metrics(metrics):
 
     # 4. Review Quality Metrics (Enhanced)
     review = metrics.review_metrics
-    avg_review_time = (
-        statistics.mean(review.time_to_first_review)
-        if review.time_to_first_review
-        else 0
-    )
+    avg_review_time = _mean(review.time_to_first_review)
 
     review_health = (
         "🟢" if avg_review_time < 4 else "🟡" if avg_review_time < 24 else "🔴"
@@ -132,11 +131,11 @@ def display_github_metrics(metrics):
     console.print(
         Panel(
             f"{review_health} [bold]Time to First Review:[/] {format_time(avg_review_time)}\n"
-            + f"[bold]Review Cycles:[/] {statistics.mean(review.review_cycles) if review.review_cycles else 0:.1f}\n"
+            + f"[bold]Review Cycles:[/] {_mean(review.review_cycles):.1f}\n"
             + f"[bold]Blocking Reviews:[/] {review.blocking_reviews_given}\n"
             + f"[bold]Active Reviewers:[/] {len(set().union(*review.reviewers_per_pr.values())) if review.reviewers_per_pr else 0}\n"
             + f"[bold]Comments Given:[/] {review.review_comments_given}\n"
-            + f"[bold]Avg Reviewers per PR:[/] {statistics.mean([len(r) for r in review.reviewers_per_pr.values()]) if review.reviewers_per_pr else 0:.1f}\n"
+            + f"[bold]Avg Reviewers per PR:[/] {_mean([len(r) for r in review.reviewers_per_pr.values()]):.1f}\n"
             + f"[bold]Review Coverage:[/] {(len(review.reviewers_per_pr) / total_prs_created * 100) if total_prs_created > 0 else 0:.1f}% PRs reviewed",
             title="[bold yellow]Review Health",
             box=box.ROUNDED,
@@ -145,9 +144,7 @@ def display_github_metrics(metrics):
 
     # 3. Code Quality - Enhanced
     quality = metrics.code_metrics
-    avg_changes = (
-        statistics.mean(quality.changes_per_pr) if quality.changes_per_pr else 0
-    )
+    avg_changes = _mean(quality.changes_per_pr)
 
     change_indicator = (
         "🟢" if avg_changes < 200 else "🟡" if avg_changes < 500 else "🔴"
@@ -156,8 +153,8 @@ def display_github_metrics(metrics):
     console.print(
         Panel(
             f"{change_indicator} [bold]Avg Changes/PR:[/] {avg_changes:.0f}\n"
-            + f"[bold]Files/PR:[/] {statistics.mean(quality.files_changed) if quality.files_changed else 0:.0f}\n"
-            + f"[bold]Commits/PR:[/] {statistics.mean(quality.commits_count) if quality.commits_count else 0:.0f}\n"
+            + f"[bold]Files/PR:[/] {_mean(quality.files_changed):.0f}\n"
+            + f"[bold]Commits/PR:[/] {_mean(quality.commits_count):.0f}\n"
             + f"[bold]Total Changes:[/] +{quality.total_additions}/-{quality.total_deletions}\n"
             + f"⚠️ [bold]Reverts:[/] {quality.reverts} | [bold]Hotfixes:[/] {quality.hotfixes}",
             title="[bold magenta]Code Quality",
@@ -168,7 +165,7 @@ def display_github_metrics(metrics):
     # 4. Team Collaboration - Enhanced
     collab = metrics.collaboration_metrics
     review_comments = list(collab.review_comments_per_pr.values())
-    avg_comments = statistics.mean(review_comments) if review_comments else 0
+    avg_comments = _mean(review_comments)
     console.print(
         Panel(
             f"[bold cyan]Cross-Team Reviews:[/] {collab.cross_team_reviews}\n"
@@ -184,9 +181,9 @@ def display_github_metrics(metrics):
 
     # 6. Time Metrics - Enhanced (New Section)
     time = metrics.time_metrics
-    avg_merge_time = statistics.mean(time.time_to_merge) if time.time_to_merge else 0
-    avg_lead_time = statistics.mean(time.lead_times) if time.lead_times else 0
-    avg_cycle_time = statistics.mean(time.cycle_time) if time.cycle_time else 0
+    avg_merge_time = _mean(time.time_to_merge)
+    avg_lead_time = _mean(time.lead_times)
+    avg_cycle_time = _mean(time.cycle_time)
 
     console.print(
         Panel(
@@ -200,16 +197,8 @@ def display_github_metrics(metrics):
 
     # 7. System Health - Enhanced
     bottleneck = metrics.bottleneck_metrics
-    avg_wait = (
-        statistics.mean(bottleneck.review_wait_times)
-        if bottleneck.review_wait_times
-        else 0
-    )
-    avg_response = (
-        statistics.mean(bottleneck.review_response_times)
-        if bottleneck.review_response_times
-        else 0
-    )
+    avg_wait = _mean(bottleneck.review_wait_times)
+    avg_response = _mean(bottleneck.review_response_times)
 
     console.print(
         Panel(
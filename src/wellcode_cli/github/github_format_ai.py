@@ -16,107 +16,11 @@ client = Anthropic(
 )
 console = Console()
 
+# Static analysis instructions, kept separate from the metrics so the
+# prefix can be served from Anthropic's prompt cache on repeated runs
+ANALYSIS_SYSTEM_PROMPT = """You are an experienced software development team analyst tasked with evaluating team performance based on provided metrics. Your goal is to offer data-driven, objective insights to improve the team's efficiency and overall performance.
 
-def format_ai_response(response):
-    # Extract metrics section first
-    metrics_match = re.search(
-        r"<metrics_extraction>(.*?)</metrics_extraction>", response, re.DOTALL
-    )
-    if metrics_match:
-        metrics_content = metrics_match.group(1).strip()
-        console.print(
-            Panel(
-                Markdown(metrics_content),
-                title="[bold yellow]Metrics Extraction[/]",
-                border_style="blue",
-                padding=(1, 2),
-            )
-        )
-
-    # Extract performance evaluation sections
-    performance_sections = {
-        "overall_efficiency": "Overall Efficiency",
-        "strengths": "Strengths",
-        "areas_for_improvement": "Areas for Improvement",
-        "recommendations": "Recommendations",
-    }
-
-    for section_tag, section_title in performance_sections.items():
-        section_match = re.search(
-            f"<{section_tag}>(.*?)</{section_tag}>", response, re.DOTALL
-        )
-        if section_match:
-            content = section_match.group(1).strip()
-            console.print(
-                Panel(
-                    Markdown(content),
-                    title=f"[bold yellow]{section_title}[/]",
-                    border_style="blue",
-                    padding=(1, 2),
-                )
-            )
-
-    # Handle efficiency score and justification separately
-    efficiency_score_match = re.search(
-        r"<efficiency_score>(.*?)</efficiency_score>", response, re.DOTALL
-    )
-    efficiency_justification_match = re.search(
-        r"<efficiency_score_justification>(.*?)</efficiency_score_justification>",
-        response,
-        re.DOTALL,
-    )
-
-    if efficiency_score_match or efficiency_justification_match:
-        content = []
-        if efficiency_score_match:
-            content.append(
-                f"[bold white]{efficiency_score_match.group(1).strip()}/10[/]"
-            )
-        if efficiency_justification_match:
-            content.append(f"\n\n{efficiency_justification_match.group(1).strip()}")
-
-        console.print(
-            Panel(
-                "\n".join(content),
-                title="[bold magenta]Efficiency Score & Justification[/]",
-                border_style="magenta",
-                padding=(1, 2),
-            )
-        )
-
-
-def get_ai_analysis(all_metrics):
-    """Generate AI analysis from all metrics sources."""
-    metrics_summary = {}
-    try:
-        # GitHub metrics
-        if "github" in all_metrics:
-            github_data = all_metrics["github"]
-            metrics_json = json.dumps(
-                github_data, cls=MetricsJSONEncoder, indent=2, default=str
-            )
-            metrics_summary = {"github": json.loads(metrics_json)}
-
-        # Linear metrics
-        if "linear" in all_metrics:
-            metrics_summary["linear"] = all_metrics["linear"]
-
-        # Split metrics
-        if "split" in all_metrics:
-            metrics_summary["split"] = all_metrics["split"]
-
-        if not metrics_summary:
-            return "No metrics data available for analysis."
-
-        # Create the prompt with the metrics
-        prompt = f"""
-You are an experienced software development team analyst tasked with evaluating team performance based on provided metrics. Your goal is to offer data-driven, objective insights to improve the team's efficiency and overall performance.
-
-Here's the metrics summary you'll be analyzing:
-
-<metrics_summary>
-{metrics_summary}
-</metrics_summary>
+The metrics summary you'll be analyzing is provided in <metrics_summary> tags.
 
 Before providing a comprehensive analysis, extract and categorize the key metrics from the summary. Wrap this step in <metrics_extraction> tags:
 
@@ -212,18 +116,159 @@ Example output structure (do not copy the content, only the structure):
 </efficiency_score>
 """
 
-        message = client.messages.create(
+ANALYSIS_SYSTEM = [
+    {
+        "type": "text",
+        "text": ANALYSIS_SYSTEM_PROMPT,
+        "cache_control": {"type": "ephemeral"},
+    }
+]
+
+
+# Sections shown as their own panel, in display order
+PANEL_SECTIONS = {
+    "metrics_extraction": "Metrics Extraction",
+    "overall_efficiency": "Overall Efficiency",
+    "strengths": "Strengths",
+    "areas_for_improvement": "Areas for Improvement",
+    "recommendations": "Recommendations",
+}
+
+# One alternation over every section the response is rendered from, so the
+# response is scanned once; performance_evaluation only wraps other sections
+RESPONSE_SECTION_RE = re.compile(
+    r"<(metrics_extraction|overall_efficiency|strengths|areas_for_improvement"
+    r"|recommendations|efficiency_score_justification|efficiency_score)>"
+    r"(.*?)</\1>",
+    re.DOTALL,
+)
+
+
+def _print_section(tag, content):
+    console.print(
+        Panel(
+            Markdown(content),
+            title=f"[bold yellow]{PANEL_SECTIONS[tag]}[/]",
+            border_style="blue",
+            padding=(1, 2),
+        )
+    )
+
+
+def _print_efficiency(sections):
+    """Print the efficiency score and justification together"""
+    efficiency_score = sections.get("efficiency_score")
+    efficiency_justification = sections.get("efficiency_score_justification")
+
+    if efficiency_score is not None or efficiency_justification is not None:
+        content = []
+        if efficiency_score is not None:
+            content.append(f"[bold white]{efficiency_score}/10[/]")
+        if efficiency_justification is not None:
+            content.append(f"\n\n{efficiency_justification}")
+
+        console.print(
+            Panel(
+                "\n".join(content),
+                title="[bold magenta]Efficiency Score & Justification[/]",
+                border_style="magenta",
+                padding=(1, 2),
+            )
+        )
+
+
+def format_ai_response(response):
+    # Keep the first occurrence of each section
+    sections = {}
+    for tag, content in RESPONSE_SECTION_RE.findall(response):
+        sections.setdefault(tag, content.strip())
+
+    for tag in PANEL_SECTIONS:
+        if tag in sections:
+            _print_section(tag, sections[tag])
+
+    # Handle efficiency score and justification separately
+    _print_efficiency(sections)
+
+
+def get_ai_analysis(all_metrics, render=False):
+    """Generate AI analysis from all metrics sources.
+
+    The response is streamed; with render=True its sections are printed as
+    they complete, instead of calling format_ai_response afterwards.
+    """
+    metrics_summary = {}
+    chunks = []
+    try:
+        # GitHub metrics
+        if "github" in all_metrics:
+            github_data = all_metrics["github"]
+            metrics_json = json.dumps(
+                github_data, cls=MetricsJSONEncoder, indent=2, default=str
+            )
+            metrics_summary = {"github": json.loads(metrics_json)}
+
+        # Linear metrics
+        if "linear" in all_metrics:
+            metrics_summary["linear"] = all_metrics["linear"]
+
+        # Split metrics
+        if "split" in all_metrics:
+            metrics_summary["split"] = all_metrics["split"]
+
+        if not metrics_summary:
+            return "No metrics data available for analysis."
+
+        # Only the metrics change between runs; the instructions are sent as a
+        # cached system prompt
+        sections = {}
+        # Text after the last complete section; only this tail is rescanned
+        pending = ""
+        with client.messages.stream(
             max_tokens=2048,
-            messages=[{"role": "user", "content": prompt}],
+            system=ANALYSIS_SYSTEM,
+            messages=[
+                {
+                    "role": "user",
+                    "content": f"<metrics_summary>\n{metrics_summary}\n</metrics_summary>",
+                }
+            ],
             model="claude-3-5-sonnet-20240620",
+        ) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+                if not render:
+                    continue
+                pending += text
+                # Show each section as soon as its closing tag arrives
+                if ">" in text:
+                    scanned = 0
+                    for match in RESPONSE_SECTION_RE.finditer(pending):
+                        scanned = match.end()
+                        tag = match.group(1)
+                        if tag not in sections:
+                            sections[tag] = match.group(2).strip()
+                            if tag in PANEL_SECTIONS:
+                                _print_section(tag, sections[tag])
+                    pending = pending[scanned:]
+            message = stream.get_final_message()
+
+        if render:
+            _print_efficiency(sections)
+
+        logging.debug(
+            "AI analysis prompt cache: %s tokens read, %s tokens written",
+            getattr(message.usage, "cache_read_input_tokens", None),
+            getattr(message.usage, "cache_creation_input_tokens", None),
         )
 
-        return message.content[0].text if message.content else ""
+        return "".join(chunks)
 
     except Exception as e:
         logging.error(f"Unexpected error in get_ai_analysis: {str(e)}")
-        logging.error("Error type:", type(e).__name__)
+        logging.error("Error type: %s", type(e).__name__)
         import traceback
 
-        logging.error("Traceback:", traceback.format_exc())
-        return ""
+        logging.error("Traceback: %s", traceback.format_exc())
+        # Keep whatever was streamed before the failure
+        return "".join(chunks)
@@ -2,6 +2,7 @@ import atexit
 import logging
 import threading
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -10,7 +11,7 @@ from . import decorators
 from .app_config import WELLCODE_APP
 from .client import GithubClient
 from .models.metrics import OrganizationMetrics
-from .utils import ensure_datetime
+from .utils import ensure_datetime, label_names
 
 console = Console()
 # Global thread pool executors
@@ -97,6 +98,8 @@ def get_github_metrics(
                 team_members = team_future.result()
 
         metrics = OrganizationMetrics(name=org_or_user)
+        # Open PRs are all aged from the time collection started
+        now = datetime.now(timezone.utc)
 
         with Progress(
             SpinnerColumn(),
@@ -117,6 +120,7 @@ def get_github_metrics(
                     user_filter,
                     team_filter,
                     team_members,
+                    now,
                 )
                 for repo in repos
             ]
@@ -136,24 +140,28 @@ def get_github_metrics(
 
 
 def process_repository_batch(
-    repo, org_metrics, start_date, end_date, user_filter, team_filter, team_members
+    repo,
+    org_metrics,
+    start_date,
+    end_date,
+    user_filter,
+    team_filter,
+    team_members,
+    now=None,
 ):
     """Process repository with proper connection handling"""
     try:
+        start_date = ensure_datetime(start_date)
+        end_date = ensure_datetime(end_date)
+
         with connection_semaphore:
             pulls_future = DATA_EXECUTOR.submit(
-                lambda: list(repo.get_pulls(state="all"))
+                get_pulls_in_range, repo, start_date, end_date
             )
             pulls = pulls_future.result()
 
-        start_date = ensure_datetime(start_date)
-        end_date = ensure_datetime(end_date)
-
         relevant_pulls = [
-            pr
-            for pr in pulls
-            if start_date <= ensure_datetime(pr.created_at) <= end_date
-            and (not user_filter or pr.user.login == user_filter)
+            pr for pr in pulls if not user_filter or pr.user.login == user_filter
         ]
 
         # Create repo metrics instance and update contributors
@@ -164,7 +172,9 @@ def process_repository_batch(
         repo_metrics.prs_created += len(relevant_pulls)
         org_metrics.prs_created += len(relevant_pulls)
 
-        merged_prs = [pr for pr in relevant_pulls if pr.merged]
+        # merged_at comes with the pull listing, while reading pr.merged makes
+        # PyGithub fetch the full PR; leave that to the parallel PR workers
+        merged_prs = [pr for pr in relevant_pulls if pr.merged_at is not None]
         repo_metrics.prs_merged += len(merged_prs)
         org_metrics.prs_merged += len(merged_prs)
 
@@ -200,7 +210,13 @@ def process_repository_batch(
 
             futures = {
                 PR_EXECUTOR.submit(
-                    process_pr, pr, repo_metrics, org_metrics, start_date, end_date
+                    process_pr,
+                    pr,
+                    repo_metrics,
+                    org_metrics,
+                    start_date,
+                    end_date,
+                    now,
                 ): pr
                 for pr in batch
             }
@@ -217,8 +233,22 @@ def process_repository_batch(
         raise
 
 
+def get_pulls_in_range(repo, start_date, end_date):
+    """List a repository's PRs created within the date range"""
+    pulls = []
+    # PRs are listed newest first, so paging stops at the first PR created
+    # before the range instead of reading the repository's whole history
+    for pr in repo.get_pulls(state="all", sort="created", direction="desc"):
+        created_at = ensure_datetime(pr.created_at)
+        if created_at < start_date:
+            break
+        if created_at <= end_date:
+            pulls.append(pr)
+    return pulls
+
+
 @safe_github_call
-def process_pr(pr, repo_metrics, org_metrics, start_date, end_date):
+def process_pr(pr, repo_metrics, org_metrics, start_date, end_date, now=None):
     """Process a single PR with optimized data fetching"""
     try:
         logging.info(f"Starting to process PR #{pr.number} by {pr.user.login}")
@@ -228,9 +258,13 @@ def process_pr(pr, repo_metrics, org_metrics, start_date, end_date):
         org_metrics.get_or_create_user(pr.user.login)
 
         pr_data = collect_pr_data(pr)
+        # Read the PR's labels once for the code and bottleneck metrics
+        labels = label_names(pr)
 
         futures = [
-            DATA_EXECUTOR.submit(update_code_metrics, pr, repo_metrics, org_metrics),
+            DATA_EXECUTOR.submit(
+                update_code_metrics, pr, labels, repo_metrics, org_metrics
+            ),
             DATA_EXECUTOR.submit(
                 update_review_metrics, pr, pr_data, repo_metrics, org_metrics
             ),
@@ -250,6 +284,9 @@ def process_pr(pr, repo_metrics, org_metrics, start_date, end_date):
                 repo_metrics,
                 org_metrics,
             ),
+            DATA_EXECUTOR.submit(
+                update_bottleneck_metrics, pr, labels, repo_metrics, org_metrics, now
+            ),
         ]
 
         for future in as_completed(futures):
@@ -263,7 +300,7 @@ def process_pr(pr, repo_metrics, org_metrics, start_date, end_date):
 @safe_github_call
 def collect_pr_data(pr):
     """Collect PR data with proper connection handling"""
-    if not pr.merged:
+    if pr.merged_at is None:
         # Skip commit fetching for unmerged PRs
         futures = {
             "reviews": DATA_EXECUTOR.submit(lambda: list(pr.get_reviews())),
@@ -293,15 +330,15 @@ def collect_pr_data(pr):
     }
 
 
-def update_code_metrics(pr, repo_metrics, org_metrics):
+def update_code_metrics(pr, labels, repo_metrics, org_metrics):
     """Update code metrics for a PR"""
     # Update organization and repository metrics
-    org_metrics.code_metrics.update_from_pr(pr)
-    repo_metrics.code_metrics.update_from_pr(pr)
+    org_metrics.code_metrics.update_from_pr(pr, labels)
+    repo_metrics.code_metrics.update_from_pr(pr, labels)
 
     # Update author's code metrics
     author_metrics = org_metrics.get_or_create_user(pr.user.login)
-    author_metrics.code_metrics.update_from_pr(pr)
+    author_metrics.code_metrics.update_from_pr(pr, labels)
 
 
 def update_review_metrics(pr, pr_data, repo_metrics, org_metrics):
@@ -355,7 +392,6 @@ def update_review_metrics(pr, pr_data, repo_metrics, org_metrics):
 
             org_metrics.bottleneck_metrics.review_response_times.append(response_time)
             repo_metrics.bottleneck_metrics.review_response_times.append(response_time)
-        org_metrics.bottleneck_metrics.review_wait_times.append(wait_time)
 
 
 def update_time_metrics(pr, commits, repo_metrics, org_metrics, start_date, end_date):
@@ -378,18 +414,18 @@ def update_time_metrics(pr, commits, repo_metrics, org_metrics, start_date, end_
             org_metrics.time_metrics.time_to_merge.append(merge_duration)
             # Calculate lead time if we have commits
             if commits and len(commits) > 0:
-                first_commit = min(
-                    commits, key=lambda c: ensure_datetime(c.commit.author.date)
+                # Normalize each commit date once while finding the earliest
+                first_commit_date = min(
+                    ensure_datetime(c.commit.author.date) for c in commits
                 )
-                first_commit_date = ensure_datetime(first_commit.commit.author.date)
                 lead_time = (merge_time - first_commit_date).total_seconds() / 3600
 
                 # Add author metrics
                 author_metrics.time_metrics.lead_times.append(lead_time)
                 repo_metrics.time_metrics.lead_times.append(lead_time)
                 org_metrics.time_metrics.lead_times.append(lead_time)
-                # Calculate cycle time
-                cycle_time = (merge_time - first_commit_date).total_seconds() / 3600
+                # Cycle time is measured over the same span as lead time
+                cycle_time = lead_time
 
                 # Add author metrics
                 author_metrics.time_metrics.cycle_time.append(cycle_time)
@@ -555,7 +591,10 @@ def get_team_members(org_or_user, team_filter: str) -> set:
     return team_members
 
 
-def update_bottleneck_metrics(pr, repo_metrics, org_metrics):
+def update_bottleneck_metrics(pr, labels, repo_metrics, org_metrics, now=None):
     """Add missing bottleneck metrics tracking"""
-    repo_metrics.bottleneck_metrics.update_from_pr(pr)
-    org_metrics.bottleneck_metrics.update_from_pr(pr)
+    # Age an open PR from the same time for the repository and organization
+    if now is None and not pr.merged_at:
+        now = datetime.now(timezone.utc)
+    repo_metrics.bottleneck_metrics.update_from_pr(pr, labels=labels, now=now)
+    org_metrics.bottleneck_metrics.update_from_pr(pr, labels=labels, now=now)
@@ -1,81 +1,187 @@
 import json
-import statistics
-from collections import defaultdict
-from dataclasses import dataclass, field
+import sys
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Set
+from typing import Counter as CounterType
+from typing import Dict, List, Optional, Set, Union, get_args, get_origin
 
-from ..utils import ensure_datetime
+import numpy as np
+
+from ..utils import ensure_datetime, label_names
+
+# Metrics objects are created per user and repository, so drop their
+# instance __dict__ where dataclasses support it
+METRICS_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Lowercased label names that mark a PR as blocked or as a hotfix
+BLOCKING_LABELS = frozenset({"blocked", "on hold"})
+HOTFIX_LABELS = frozenset({"hotfix"})
+
+
+# Converters for the exact types metrics hold, checked before the slower
+# isinstance chain in MetricsJSONEncoder.default
+_JSON_CONVERTERS = {
+    datetime: datetime.isoformat,
+    set: list,
+    frozenset: list,
+    defaultdict: dict,
+}
 
 
 class MetricsJSONEncoder(json.JSONEncoder):
     def default(self, obj):
+        converter = _JSON_CONVERTERS.get(type(obj))
+        if converter is not None:
+            return converter(obj)
         if isinstance(obj, datetime):
             return obj.isoformat()
-        if isinstance(obj, set):
+        if isinstance(obj, (set, frozenset)):
             return list(obj)
         if isinstance(obj, defaultdict):
             return dict(obj)
         if callable(obj):
             return None
+        # Slotted metrics have no __dict__ and convert themselves
+        if hasattr(obj, "to_dict"):
+            return obj.to_dict()
         if hasattr(obj, "__dict__"):
             return {
                 k: v
                 for k, v in obj.__dict__.items()
                 if not k.startswith("_") and not callable(v)
             }
-        try:
-            return super().default(obj)
-        except Exception:
-            return str(obj)
+        # JSONEncoder.default would only raise, anything else is written as text
+        return str(obj)
+
+
+def _convert(obj):
+    """Convert a metrics value to plain types"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    if isinstance(obj, dict):
+        # Only sets and nested metrics inside a dict need converting, such
+        # as the sets in reviewers_per_pr or the repositories of an org
+        return {
+            k: _convert(v) if isinstance(v, (set, BaseMetrics)) else v
+            for k, v in obj.items()
+        }
+    if callable(obj):
+        return None
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "__dict__"):
+        return _convert_fields(obj.__dict__)
+    return obj
+
+
+def _convert_fields(fields):
+    """Convert the public, non-callable fields of a metrics object"""
+    return {
+        k: _convert(v)
+        for k, v in fields.items()
+        if not k.startswith("_") and not callable(v)
+    }
+
+
+def _mean(values) -> float:
+    """Mean of a list of numbers, 0 when it is empty"""
+    return sum(values) / len(values) if values else 0
+
+
+def _median(values) -> float:
+    """Median of a list of numbers, 0 when it is empty"""
+    # np.median selects in C instead of sorting the whole list
+    return float(np.median(values)) if values else 0
+
+
+def _is_metrics(annotation) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseMetrics)
+
+
+def _field_expression(value: str, annotation) -> str:
+    """Source converting one annotated field of a metrics object to plain types"""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union and type(None) in args:
+        (inner,) = [arg for arg in args if arg is not type(None)]
+        return f"(None if {value} is None else {_field_expression(value, inner)})"
+    if annotation in (int, float, str, bool):
+        return value
+    if annotation is datetime:
+        return f"{value}.isoformat()"
+    if origin in (list, set):
+        return f"list({value})"
+    if _is_metrics(annotation):
+        return f"{value}.to_dict()"
+    if origin is dict:
+        if get_origin(args[1]) is set:
+            return f"{{k: list(v) for k, v in {value}.items()}}"
+        if _is_metrics(args[1]):
+            return f"{{k: v.to_dict() for k, v in {value}.items()}}"
+        return f"dict({value})"
+    if origin is Counter:
+        return f"dict({value})"
+    return f"_convert({value})"
 
 
 @dataclass
 class BaseMetrics:
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Generate a to_dict that converts each annotated field directly"""
+        super().__init_subclass__(**kwargs)
+        if "to_dict" in cls.__dict__:
+            return
+
+        # @dataclass runs after this hook, so read the annotations it will
+        # turn into fields
+        annotations = {}
+        for klass in reversed(cls.__mro__):
+            annotations.update(klass.__dict__.get("__annotations__", {}))
+        lines = [
+            f"        {name!r}: {_field_expression(f'self.{name}', annotation)},"
+            for name, annotation in annotations.items()
+            if not name.startswith("_")
+        ]
+        source = "def to_dict(self):\n    return {\n" + "\n".join(lines) + "\n    }\n"
+        namespace = {"_convert": _convert}
+        exec(source, namespace)
+
+        # Kept on the class so the generated code can be inspected
+        cls._to_dict_source = source
+        cls.to_dict = namespace["to_dict"]
+
     def to_dict(self):
-        def convert(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            if isinstance(obj, set):
-                return list(obj)
-            if isinstance(obj, defaultdict):
-                return dict(obj)
-            if callable(obj):
-                return None
-            if hasattr(obj, "to_dict"):
-                return obj.to_dict()
-            if hasattr(obj, "__dict__"):
-                return {
-                    k: convert(v)
-                    for k, v in obj.__dict__.items()
-                    if not k.startswith("_") and not callable(v)
-                }
-            return obj
-
-        result = {}
-        for k, v in self.__dict__.items():
-            if not k.startswith("_") and not callable(v):
-                result[k] = convert(v)
-        return result
+        return _convert_fields({f.name: getattr(self, f.name) for f in fields(self)})
 
 
-@dataclass
+@dataclass(**METRICS_DATACLASS_OPTIONS)
 class BottleneckMetrics(BaseMetrics):
     stale_prs: int = 0
     long_running_prs: int = 0
     blocked_prs: int = 0
     review_wait_times: List[float] = field(default_factory=list)
     review_response_times: List[float] = field(default_factory=list)
-    bottleneck_users: Dict[str, int] = field(default_factory=dict)
+    bottleneck_users: CounterType[str] = field(default_factory=Counter)
 
     def update_from_pr(
-        self, pr, stale_threshold: float = 168, long_running_threshold: float = 336
+        self,
+        pr,
+        stale_threshold: float = 168,
+        long_running_threshold: float = 336,
+        labels=None,
+        now: Optional[datetime] = None,
     ):
         """Update metrics from a PR (thresholds in hours)"""
         if not pr.merged_at:
             # Ensure timezone-aware datetime
             created_at = ensure_datetime(pr.created_at)
-            current_time = datetime.now(timezone.utc)
+            # Batch callers pass one "now" so every PR is aged from the same time
+            current_time = now or datetime.now(timezone.utc)
             age = (current_time - created_at).total_seconds() / 3600
 
             if age > stale_threshold:
@@ -84,39 +190,27 @@ class BottleneckMetrics(BaseMetrics):
                 self.long_running_prs += 1
 
             # Track blocked PRs
-            if any(label.name.lower() in ["blocked", "on hold"] for label in pr.labels):
+            if labels is None:
+                labels = label_names(pr)
+            if not BLOCKING_LABELS.isdisjoint(labels):
                 self.blocked_prs += 1
-                self.bottleneck_users[pr.user.login] = (
-                    self.bottleneck_users.get(pr.user.login, 0) + 1
-                )
+                self.bottleneck_users[pr.user.login] += 1
 
-            # Fix timezone awareness for review wait times
-            if pr.get_reviews().totalCount > 0:
-                first_review = min(pr.get_reviews(), key=lambda r: r.submitted_at)
-                review_time = ensure_datetime(first_review.submitted_at)
-                wait_time = (review_time - created_at).total_seconds() / 3600
-                self.review_wait_times.append(wait_time)
+            # The first-review wait is recorded by update_review_metrics from
+            # the reviews it already has, for open and merged PRs alike
 
     def get_stats(self) -> Dict:
         return {
             "stale_prs": self.stale_prs,
             "long_running_prs": self.long_running_prs,
             "blocked_prs": self.blocked_prs,
-            "avg_review_wait_time": (
-                statistics.mean(self.review_wait_times) if self.review_wait_times else 0
-            ),
-            "avg_response_time": (
-                statistics.mean(self.review_response_times)
-                if self.review_response_times
-                else 0
-            ),
-            "top_bottleneck_users": sorted(
-                self.bottleneck_users.items(), key=lambda x: x[1], reverse=True
-            )[:5],
+            "avg_review_wait_time": _mean(self.review_wait_times),
+            "avg_response_time": _mean(self.review_response_times),
+            "top_bottleneck_users": self.bottleneck_users.most_common(5),
         }
 
 
-@dataclass
+@dataclass(**METRICS_DATACLASS_OPTIONS)
 class ReviewMetrics(BaseMetrics):
     reviews_performed: int = 0
     blocking_reviews_given: int = 0
@@ -128,6 +222,10 @@ class ReviewMetrics(BaseMetrics):
     reviewers_per_pr: Dict[int, Set[str]] = field(
         default_factory=lambda: defaultdict(set)
     )
+    # PR numbers already counted in time_to_first_review
+    _prs_with_first_review: Set[int] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
 
     def update_from_review(self, review, pr, org_metrics=None):
         """Update metrics from a single review"""
@@ -147,7 +245,8 @@ class ReviewMetrics(BaseMetrics):
             pr_author_metrics = org_metrics.get_or_create_user(pr.user.login)
             pr_author_metrics.review_metrics.review_comments_received += 1
 
-        if pr.number not in self.time_to_first_review:
+        if pr.number not in self._prs_with_first_review:
+            self._prs_with_first_review.add(pr.number)
             review_time = (review.submitted_at - pr.created_at).total_seconds() / 3600
             self.time_to_first_review.append(review_time)
 
@@ -159,24 +258,16 @@ class ReviewMetrics(BaseMetrics):
         return {
             "reviews_performed": self.reviews_performed,
             "blocking_reviews": self.blocking_reviews_given,
-            "avg_time_to_first_review": (
-                statistics.mean(self.time_to_first_review)
-                if self.time_to_first_review
-                else 0
-            ),
-            "avg_review_cycles": (
-                statistics.mean(self.review_cycles) if self.review_cycles else 0
-            ),
-            "avg_reviewers_per_pr": (
-                statistics.mean([len(r) for r in self.reviewers_per_pr.values()])
-                if self.reviewers_per_pr
-                else 0
+            "avg_time_to_first_review": _mean(self.time_to_first_review),
+            "avg_review_cycles": _mean(self.review_cycles),
+            "avg_reviewers_per_pr": _mean(
+                [len(r) for r in self.reviewers_per_pr.values()]
             ),
             "total_comments": self.review_comments_given,
         }
 
 
-@dataclass
+@dataclass(**METRICS_DATACLASS_OPTIONS)
 class CodeMetrics(BaseMetrics):
     changes_per_pr: List[int] = field(default_factory=list)
     files_changed: List[int] = field(default_factory=list)
@@ -187,43 +278,41 @@ class CodeMetrics(BaseMetrics):
     total_deletions: int = 0
     avg_pr_size: float = 0
 
-    def update_from_pr(self, pr):
+    def update_from_pr(self, pr, labels=None):
         """Update metrics from a pull request"""
         changes = pr.additions + pr.deletions
         self.changes_per_pr.append(changes)
-        self.files_changed.append(len(list(pr.get_files())))
-        self.commits_count.append(len(list(pr.get_commits())))
+        # The PR itself carries these counts, listing its files and commits
+        # would page through the API again for every metrics object
+        self.files_changed.append(pr.changed_files)
+        self.commits_count.append(pr.commits)
         self.total_additions += pr.additions
         self.total_deletions += pr.deletions
 
         if "revert" in pr.title.lower():
             self.reverts += 1
-        if "hotfix" in pr.title.lower() or any(
-            label.name.lower() == "hotfix" for label in pr.labels
-        ):
+        if labels is None:
+            labels = label_names(pr)
+        if "hotfix" in pr.title.lower() or not HOTFIX_LABELS.isdisjoint(labels):
             self.hotfixes += 1
 
-        if self.changes_per_pr:
-            self.avg_pr_size = sum(self.changes_per_pr) / len(self.changes_per_pr)
+        # The totals already hold the sum of changes_per_pr
+        self.avg_pr_size = (self.total_additions + self.total_deletions) / len(
+            self.changes_per_pr
+        )
 
     def get_stats(self) -> Dict:
         return {
-            "avg_changes_per_pr": (
-                statistics.mean(self.changes_per_pr) if self.changes_per_pr else 0
-            ),
-            "avg_files_changed": (
-                statistics.mean(self.files_changed) if self.files_changed else 0
-            ),
-            "avg_commits": (
-                statistics.mean(self.commits_count) if self.commits_count else 0
-            ),
+            "avg_changes_per_pr": _mean(self.changes_per_pr),
+            "avg_files_changed": _mean(self.files_changed),
+            "avg_commits": _mean(self.commits_count),
             "reverts": self.reverts,
             "hotfixes": self.hotfixes,
             "total_changes": self.total_additions + self.total_deletions,
         }
 
 
-@dataclass
+@dataclass(**METRICS_DATACLASS_OPTIONS)
 class TimeMetrics(BaseMetrics):
     time_to_merge: List[float] = field(default_factory=list)
     lead_times: List[float] = field(default_factory=list)
@@ -263,31 +352,23 @@ class TimeMetrics(BaseMetrics):
 
     def get_stats(self) -> Dict:
         return {
-            "avg_time_to_merge": (
-                statistics.mean(self.time_to_merge) if self.time_to_merge else 0
-            ),
-            "median_time_to_merge": (
-                statistics.median(self.time_to_merge) if self.time_to_merge else 0
-            ),
-            "avg_lead_time": statistics.mean(self.lead_times) if self.lead_times else 0,
-            "median_lead_time": (
-                statistics.median(self.lead_times) if self.lead_times else 0
-            ),
+            "avg_time_to_merge": _mean(self.time_to_merge),
+            "median_time_to_merge": _median(self.time_to_merge),
+            "avg_lead_time": _mean(self.lead_times),
+            "median_lead_time": _median(self.lead_times),
             "merge_distribution": self.merge_distribution,
             "deployment_frequency": self.deployment_frequency,
-            "avg_cycle_time": (
-                statistics.mean(self.cycle_time) if self.cycle_time else 0
-            ),
+            "avg_cycle_time": _mean(self.cycle_time),
         }
 
 
-@dataclass
+@dataclass(**METRICS_DATACLASS_OPTIONS)
 class CollaborationMetrics(BaseMetrics):
     cross_team_reviews: int = 0
     self_merges: int = 0
     team_reviews: int = 0
     external_reviews: int = 0
-    review_comments_per_pr: Dict[int, int] = field(default_factory=dict)
+    review_comments_per_pr: CounterType[int] = field(default_factory=Counter)
     review_participation_rate: float = 0
     comments_by_user: Dict[str, Dict[int, int]] = field(
         default_factory=lambda: defaultdict(lambda: defaultdict(int))
@@ -313,9 +394,7 @@ class CollaborationMetrics(BaseMetrics):
 
         # Track comments
         if review.body:
-            self.review_comments_per_pr[pr.number] = (
-                self.review_comments_per_pr.get(pr.number, 0) + 1
-            )
+            self.review_comments_per_pr[pr.number] += 1
             self.comments_by_user[reviewer][pr.number] += 1
 
     def update_from_comments(self, comments, pr_number: int):
@@ -326,9 +405,7 @@ class CollaborationMetrics(BaseMetrics):
 
             commenter = comment.user.login
             self.comments_by_user[commenter][pr_number] += 1
-            self.review_comments_per_pr[pr_number] = (
-                self.review_comments_per_pr.get(pr_number, 0) + 1
-            )
+            self.review_comments_per_pr[pr_number] += 1
 
     def get_stats(self) -> Dict:
         total_reviews = (
@@ -353,7 +430,7 @@ class CollaborationMetrics(BaseMetrics):
         }
 
 
-@dataclass
+@dataclass(**METRICS_DATACLASS_OPTIONS)
 class UserMetrics(BaseMetrics):
     username: str
     team: str = ""
@@ -372,7 +449,7 @@ class UserMetrics(BaseMetrics):
         return self.username
 
 
-@dataclass
+@dataclass(**METRICS_DATACLASS_OPTIONS)
 class RepositoryMetrics(BaseMetrics):
     name: str
     default_branch: str = "main"
@@ -406,7 +483,7 @@ class RepositoryMetrics(BaseMetrics):
             self.last_updated = timestamp
 
 
-@dataclass
+@dataclass(**METRICS_DATACLASS_OPTIONS)
 class OrganizationMetrics(BaseMetrics):
     name: str
     repositories: Dict[str, RepositoryMetrics] = field(default_factory=dict)
@@ -451,16 +528,8 @@ class OrganizationMetrics(BaseMetrics):
             "prs_merged": repo.prs_merged,
             "contributors_count": len(repo.contributors),
             "teams_involved": len(repo.teams_involved),
-            "avg_time_to_merge": (
-                statistics.mean(repo.time_metrics.time_to_merge)
-                if repo.time_metrics.time_to_merge
-                else 0
-            ),
-            "avg_review_time": (
-                statistics.mean(repo.review_metrics.review_wait_times)
-                if repo.review_metrics.review_wait_times
-                else 0
-            ),
+            "avg_time_to_merge": _mean(repo.time_metrics.time_to_merge),
+            "avg_review_time": _mean(repo.review_metrics.review_wait_times),
             "hotfixes": repo.code_metrics.hotfixes,
             "reverts": repo.code_metrics.reverts,
             "last_updated": repo.last_updated,
@@ -478,16 +547,15 @@ class OrganizationMetrics(BaseMetrics):
         return all_contributors
 
     def to_dict(self):
-        return {
+        fields = {
             "name": self.name,
-            "repositories": {
-                name: repo.to_dict() for name, repo in self.repositories.items()
-            },
-            "users": {name: user.to_dict() for name, user in self.users.items()},
-            "teams": {team: list(members) for team, members in self.teams.items()},
-            "review_metrics": self.review_metrics.to_dict(),
-            "code_metrics": self.code_metrics.to_dict(),
-            "time_metrics": self.time_metrics.to_dict(),
-            "collaboration_metrics": self.collaboration_metrics.to_dict(),
-            "bottleneck_metrics": self.bottleneck_metrics.to_dict(),
+            "repositories": self.repositories,
+            "users": self.users,
+            "teams": self.teams,
+            "review_metrics": self.review_metrics,
+            "code_metrics": self.code_metrics,
+            "time_metrics": self.time_metrics,
+            "collaboration_metrics": self.collaboration_metrics,
+            "bottleneck_metrics": self.bottleneck_metrics,
         }
+        return _convert_fields(fields)
@@ -1,16 +1,28 @@
 from datetime import date, datetime, timezone
+from functools import lru_cache
 
 
 def ensure_datetime(dt) -> datetime:
     """Ensure datetime has timezone information"""
+    # Aware datetimes are returned as they are. They are not cached, because
+    # equal instants in different time zones would share one cache entry
+    # and callers read weekday() and hour from the result
+    if isinstance(dt, datetime) and dt.tzinfo is not None:
+        return dt
+    return _to_aware_datetime(dt)
+
+
+# Each PR's timestamps are normalized by several metrics. Naive datetimes,
+# dates and strings only compare equal when they convert to the same value,
+# so the conversions can be shared
+@lru_cache(maxsize=8192, typed=True)
+def _to_aware_datetime(dt) -> datetime:
     if dt is None:
         return None
 
     # If it's already a datetime
     if isinstance(dt, datetime):
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=timezone.utc)
-        return dt
+        return dt.replace(tzinfo=timezone.utc)
 
     # If it's a string or date, convert to datetime
     if isinstance(dt, str):
@@ -23,3 +35,8 @@ def ensure_datetime(dt) -> datetime:
         dt = dt.replace(tzinfo=timezone.utc)
 
     return dt
+
+
+def label_names(pr) -> set:
+    """Lowercased names of a PR's labels"""
+    return {label.name.lower() for label in pr.labels}
@@ -1,6 +1,7 @@
 import logging
 from datetime import datetime, timedelta
 
+import numpy as np
 import requests
 from dateutil import parser, tz
 from rich.console import Console
@@ -11,6 +12,7 @@ from .models.metrics import LinearOrgMetrics, ProjectMetrics, TeamMetrics
 console = Console()
 
 LINEAR_API_ENDPOINT = "https://api.linear.app/graphql"
+ONE_DAY = timedelta(days=1)
 
 
 def get_linear_metrics(start_date, end_date, user_filter=None) -> LinearOrgMetrics:
@@ -90,7 +92,7 @@ def get_linear_metrics(start_date, end_date, user_filter=None) -> LinearOrgMetri
         data = response.json()
 
         if "errors" in data:
-            logging.error("Error in Linear API response:", data["errors"])
+            logging.error("Error in Linear API response: %s", data["errors"])
             raise RuntimeError(f"Linear API error: {data['errors']}")
 
         issues_data = data["data"]["issues"]
@@ -172,6 +174,7 @@ def calculate_estimation_accuracy(issues):
             "underestimates": 0,
             "overestimates": 0,
             "estimation_variance": [],
+            "errors": [],
         }
 
     accuracy_metrics = {
@@ -180,6 +183,7 @@ def calculate_estimation_accuracy(issues):
         "underestimates": 0,
         "overestimates": 0,
         "estimation_variance": [],
+        "errors": [],
     }
 
     for issue in estimated_issues:
@@ -209,8 +213,10 @@ def calculate_estimation_accuracy(issues):
                 accuracy_metrics["overestimates"] += 1
 
         except Exception as e:
-            # Log the error or handle it more specifically
-            console.print(f"Error calculating estimation accuracy: {str(e)}")
+            # Collected rather than printed: this may run off the main thread
+            accuracy_metrics["errors"].append(
+                f"Error calculating estimation accuracy: {str(e)}"
+            )
             continue
 
     return accuracy_metrics
@@ -272,6 +278,13 @@ def calculate_work_hours(start_date, end_date):
     return total_hours
 
 
+def _count_weekdays(start_day, end_day):
+    """Count Monday-Friday dates in the half-open range [start_day, end_day)"""
+    if end_day <= start_day:
+        return 0
+    return int(np.busday_count(start_day, end_day))
+
+
 def calculate_work_points(start_date, end_date):
     """Calculate work points based on working days between dates"""
     if not start_date or not end_date:
@@ -283,19 +296,10 @@ def calculate_work_points(start_date, end_date):
     if end_date.tzinfo:
         end_date = end_date.astimezone(tz.UTC)
 
-    # Calculate working days (excluding weekends)
-    total_points = 0
-    current_date = start_date
-
-    while current_date < end_date:
-        if current_date.weekday() < 5:  # Monday to Friday
-            # Add 1 point per working day
-            total_points += 1
-
-        # Move to next day
-        current_date = current_date + timedelta(days=1)
-
-    return total_points
+    # 1 point per working day, stepping a day at a time from start_date
+    steps = -((start_date - end_date) // ONE_DAY)
+    start_day = start_date.date()
+    return _count_weekdays(start_day, start_day + steps * ONE_DAY)
 
 
 def calculate_working_days(start_date, end_date):
@@ -309,16 +313,8 @@ def calculate_working_days(start_date, end_date):
     if end_date.tzinfo:
         end_date = end_date.astimezone(tz.UTC)
 
-    working_days = 0
-    current_date = start_date.date()  # Use date only for day counting
-    end_date = end_date.date()
-
-    while current_date <= end_date:
-        if current_date.weekday() < 5:  # Monday to Friday
-            working_days += 1
-        current_date += timedelta(days=1)
-
-    return working_days
+    # Use date only for day counting, end date inclusive
+    return _count_weekdays(start_date.date(), end_date.date() + ONE_DAY)
 
 
 def points_to_expected_hours(points):
@@ -5,12 +5,24 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Set
 
+# Converters for the exact types metrics hold, checked before the slower
+# isinstance chain in MetricsJSONEncoder.default
+_JSON_CONVERTERS = {
+    datetime: datetime.isoformat,
+    set: list,
+    frozenset: list,
+    defaultdict: dict,
+}
+
 
 class MetricsJSONEncoder(json.JSONEncoder):
     def default(self, obj):
+        converter = _JSON_CONVERTERS.get(type(obj))
+        if converter is not None:
+            return converter(obj)
         if isinstance(obj, datetime):
             return obj.isoformat()
-        if isinstance(obj, set):
+        if isinstance(obj, (set, frozenset)):
             return list(obj)
         if isinstance(obj, defaultdict):
             return dict(obj)
@@ -22,10 +34,8 @@ class MetricsJSONEncoder(json.JSONEncoder):
                 for k, v in obj.__dict__.items()
                 if not k.startswith("_") and not callable(v)
             }
-        try:
-            return super().default(obj)
-        except Exception:
-            return str(obj)
+        # JSONEncoder.default would only raise, anything else is written as text
+        return str(obj)
 
 
 @dataclass
@@ -57,6 +67,19 @@ class BaseMetrics:
         }
 
 
+def _classify_labels(issue: dict):
+    """Return (is_bug, is_feature) for an issue in a single pass over its labels"""
+    is_bug = False
+    is_feature = False
+    for label in issue.get("labels", {}).get("nodes", []):
+        name = label.get("name", "").lower()
+        if name == "bug":
+            is_bug = True
+        elif name in ("feature", "enhancement"):
+            is_feature = True
+    return is_bug, is_feature
+
+
 @dataclass
 class IssueMetrics(BaseMetrics):
     total_created: int = 0
@@ -119,32 +142,27 @@ class IssueMetrics(BaseMetrics):
         state = issue.get("state", {})
         state_type = state.get("type")
         state_name = state.get("name", "Unknown")
+        is_completed = state_type == "completed"
+        is_in_progress = state_type in ("started", "inProgress")
 
         # Update state metrics
         self.by_state[state_name] += 1
 
-        if state_type == "completed":
+        if is_completed:
             self.total_completed += 1
-        elif state_type in ["started", "inProgress"]:
+        elif is_in_progress:
             self.total_in_progress += 1
 
         # Update bug/feature metrics
-        is_bug = any(
-            label.get("name", "").lower() == "bug"
-            for label in issue.get("labels", {}).get("nodes", [])
-        )
-        is_feature = any(
-            label.get("name", "").lower() in ["feature", "enhancement"]
-            for label in issue.get("labels", {}).get("nodes", [])
-        )
+        is_bug, is_feature = _classify_labels(issue)
 
         if is_bug:
             self.bugs_created += 1
-            if state_type == "completed":
+            if is_completed:
                 self.bugs_completed += 1
         elif is_feature:
             self.features_created += 1
-            if state_type == "completed":
+            if is_completed:
                 self.features_completed += 1
 
         # Update priority metrics
@@ -167,9 +185,9 @@ class IssueMetrics(BaseMetrics):
                     self.by_project[project_key]["bugs"] += 1
                 elif is_feature:
                     self.by_project[project_key]["features"] += 1
-                if state_type == "completed":
+                if is_completed:
                     self.by_project[project_key]["completed"] += 1
-                elif state_type in ["started", "inProgress"]:
+                elif is_in_progress:
                     self.by_project[project_key]["in_progress"] += 1
 
 
@@ -401,16 +419,14 @@ class TeamMetrics(BaseMetrics):
 
     def update_from_issue(self, issue: dict):
         self.issues_created += 1
-        if issue.get("state", {}).get("type") == "completed":
+        is_completed = issue.get("state", {}).get("type") == "completed"
+        if is_completed:
             self.issues_completed += 1
 
-        is_bug = any(
-            label.get("name", "").lower() == "bug"
-            for label in issue.get("labels", {}).get("nodes", [])
-        )
+        is_bug, _ = _classify_labels(issue)
         if is_bug:
             self.bugs_created += 1
-            if issue.get("state", {}).get("type") == "completed":
+            if is_completed:
                 self.bugs_completed += 1
 
         assignee = issue.get("assignee", {}).get("name")
@@ -430,7 +446,7 @@ class TeamMetrics(BaseMetrics):
                 self.projects[project_key]["total_issues"] += 1
                 if is_bug:
                     self.projects[project_key]["bugs"] += 1
-                if issue.get("state", {}).get("type") == "completed":
+                if is_completed:
                     self.projects[project_key]["completed_issues"] += 1
 
 
@@ -478,14 +494,7 @@ class ProjectMetrics(BaseMetrics):
             self.completed_issues += 1
 
         # Update bug/feature counts
-        is_bug = any(
-            label.get("name", "").lower() == "bug"
-            for label in issue.get("labels", {}).get("nodes", [])
-        )
-        is_feature = any(
-            label.get("name", "").lower() in ["feature", "enhancement"]
-            for label in issue.get("labels", {}).get("nodes", [])
-        )
+        is_bug, is_feature = _classify_labels(issue)
 
         if is_bug:
             self.bugs_count += 1
@@ -523,15 +532,19 @@ class LinearOrgMetrics(BaseMetrics):
     def aggregate_metrics(self):
         """Aggregate metrics across all teams and projects"""
         for team in self.teams.values():
-            team_issues = [i for i in team.projects.values()]
-            if team_issues:
-                team.avg_cycle_time = statistics.mean(
-                    [i["cycle_time"] for i in team_issues if i.get("cycle_time")]
-                )
-                team.estimation_accuracy = statistics.mean(
-                    [
-                        i["estimation_accuracy"]
-                        for i in team_issues
-                        if i.get("estimation_accuracy")
-                    ]
-                )
+            cycle_total = cycle_count = 0
+            accuracy_total = accuracy_count = 0
+            for project in team.projects.values():
+                cycle_time = project.get("cycle_time")
+                if cycle_time:
+                    cycle_total += cycle_time
+                    cycle_count += 1
+                accuracy = project.get("estimation_accuracy")
+                if accuracy:
+                    accuracy_total += accuracy
+                    accuracy_count += 1
+
+            team.avg_cycle_time = cycle_total / cycle_count if cycle_count else 0
+            team.estimation_accuracy = (
+                accuracy_total / accuracy_count if accuracy_count else 0
+            )
@@ -1,11 +1,13 @@
 import logging
-from datetime import date, datetime, timedelta
+import time
+from datetime import date, datetime
+from functools import lru_cache
+from operator import attrgetter
 
-from rich.console import Console
+import numpy as np
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
-from splitio import get_factory
-from splitio.exceptions import TimeoutException
 
 from .config import get_split_api_key
 
@@ -20,9 +22,51 @@ logging.getLogger("splitio-auth").setLevel(logging.CRITICAL)
 
 console = Console()
 
+WEEK_SECONDS = 7 * 24 * 60 * 60
+
+# SplitView always carries traffic_type, so no getattr fallback is needed
+_split_fields = attrgetter(
+    "name",
+    "traffic_type",
+    "killed",
+    "change_number",
+    "treatments",
+    "configs",
+    "default_treatment",
+)
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    return datetime.fromtimestamp(seconds).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _format_change_number(change_number: int) -> str:
+    """Format a millisecond change number; splits often share the same second"""
+    return _format_seconds(change_number // 1000)
+
+
+def _empty_metrics(errors=None):
+    """Return the Split.io metrics envelope with no data"""
+    return {
+        "total_splits": 0,
+        "active_splits": 0,
+        "splits_by_environment": {},
+        "treatments_served": 0,
+        "top_splits": [],
+        "changed_splits": [],
+        "no_traffic_splits": [],
+        "recently_modified_count": 0,
+        "errors": errors if errors is not None else [],
+    }
+
 
 def get_split_metrics(start_date: date, end_date: date):
     """Get Split.io metrics for the specified date range"""
+    # The Split SDK is slow to import, so only load it when metrics are needed
+    from splitio import get_factory
+    from splitio.exceptions import TimeoutException
+
     # Convert date to datetime for timestamp
     start_dt = datetime.combine(start_date, datetime.min.time())
     end_dt = datetime.combine(end_date, datetime.max.time())
@@ -34,17 +78,7 @@ def get_split_metrics(start_date: date, end_date: date):
     try:
         # Initialize with environment variable
         if not get_split_api_key():
-            return {
-                "total_splits": 0,
-                "active_splits": 0,
-                "splits_by_environment": {},
-                "treatments_served": 0,
-                "top_splits": [],
-                "changed_splits": [],
-                "no_traffic_splits": [],
-                "recently_modified_count": 0,
-                "errors": ["SPLIT_API_KEY not set in environment"],
-            }
+            return _empty_metrics(["SPLIT_API_KEY not set in environment"])
 
         factory = get_factory(
             get_split_api_key(), config={"impressionsMode": "optimized"}
@@ -52,17 +86,7 @@ def get_split_metrics(start_date: date, end_date: date):
         client = factory.client()
         split_manager = factory.manager()
 
-        metrics = {
-            "total_splits": 0,
-            "active_splits": 0,
-            "splits_by_environment": {},
-            "treatments_served": 0,
-            "top_splits": [],
-            "changed_splits": [],
-            "no_traffic_splits": [],
-            "recently_modified_count": 0,
-            "errors": [],
-        }
+        metrics = _empty_metrics()
 
         try:
             factory.block_until_ready(5)
@@ -71,67 +95,79 @@ def get_split_metrics(start_date: date, end_date: date):
             metrics["total_splits"] = len(splits)
 
             # Get current timestamp for "recent" comparison (last 7 days)
-            week_ago_ts = int((datetime.now() - timedelta(days=7)).timestamp() * 1000)
+            week_ago_ts = int(time.time() - WEEK_SECONDS) * 1000
 
-            for split in splits:
-                if not split.killed:
-                    metrics["active_splits"] += 1
+            # Read the SDK attributes once per split
+            rows = [_split_fields(split) for split in splits]
 
-                # Check for recent modifications (last 7 days)
-                if split.change_number >= week_ago_ts:
-                    metrics["recently_modified_count"] += 1
+            # Compare all change numbers against the time windows at once
+            change_numbers = np.fromiter(
+                (row[3] for row in rows), dtype=np.int64, count=len(rows)
+            )
+            metrics["recently_modified_count"] = int(
+                (change_numbers >= week_ago_ts).sum()
+            )
+            changed_mask = (change_numbers >= start_ts) & (change_numbers <= end_ts)
+
+            for index, (row, changed) in enumerate(zip(rows, changed_mask.tolist())):
+                (
+                    name,
+                    traffic_type,
+                    killed,
+                    change_number,
+                    treatments,
+                    configs,
+                    default,
+                ) = row
+                status = "killed" if killed else "active"
+                last_modified = _format_change_number(change_number)
+
+                if not killed:
+                    metrics["active_splits"] += 1
 
                 # Check for splits with no traffic
-                if not getattr(split, "traffic_type", "") or split.killed:
+                if not traffic_type or killed:
                     metrics["no_traffic_splits"].append(
                         {
-                            "name": split.name,
-                            "status": "active" if not split.killed else "killed",
-                            "last_modified": datetime.fromtimestamp(
-                                split.change_number / 1000
-                            ).strftime("%Y-%m-%d %H:%M:%S"),
+                            "name": name,
+                            "status": status,
+                            "last_modified": last_modified,
                         }
                     )
 
                 # Check if the split was changed during our date range
-                if start_ts <= split.change_number <= end_ts:
+                if changed:
                     metrics["changed_splits"].append(
                         {
-                            "name": split.name,
-                            "change_time": datetime.fromtimestamp(
-                                split.change_number / 1000
-                            ).strftime("%Y-%m-%d %H:%M:%S"),
-                            "status": "active" if not split.killed else "killed",
-                            "treatments": split.treatments,
+                            "name": name,
+                            "change_time": last_modified,
+                            "status": status,
+                            "treatments": treatments,
+                        }
+                    )
+
+                # Store top splits with more useful information
+                if index < 5:
+                    metrics["top_splits"].append(
+                        {
+                            "name": name,
+                            "traffic_type": traffic_type,
+                            "status": status,
+                            "treatments": treatments,
+                            "default": default,
+                            "has_rules": len(treatments) > 1,
+                            "configs": configs,
+                            "last_modified": last_modified,
                         }
                     )
 
-            # Store top splits with more useful information
-            metrics["top_splits"] = [
-                {
-                    "name": split.name,
-                    "traffic_type": split.traffic_type,
-                    "status": "active" if not split.killed else "killed",
-                    "treatments": split.treatments,
-                    "default": split.default_treatment,
-                    "has_rules": len(split.treatments) > 1,
-                    "configs": split.configs,
-                    "last_modified": datetime.fromtimestamp(
-                        split.change_number / 1000
-                    ).strftime("%Y-%m-%d %H:%M:%S"),
-                }
-                for split in list(splits)[:5]
-            ]
-
-            metrics["splits_by_environment"] = {"production": metrics["total_splits"]}
+            metrics["splits_by_environment"]["production"] = metrics["total_splits"]
 
         except TimeoutException:
             error_message = "Timeout while waiting for Split.io client to be ready"
-            console.print(f"[yellow]{error_message}[/]")
             metrics["errors"].append(error_message)
         except Exception as e:
             error_message = f"Error fetching Split.io metrics: {str(e)}"
-            console.print(f"[yellow]{error_message}[/]")
             metrics["errors"].append(error_message)
 
         finally:
@@ -141,17 +177,7 @@ def get_split_metrics(start_date: date, end_date: date):
 
     except Exception as e:
         error_message = f"Error initializing Split client: {str(e)}"
-        return {
-            "total_splits": 0,
-            "active_splits": 0,
-            "splits_by_environment": {},
-            "treatments_served": 0,
-            "top_splits": [],
-            "changed_splits": [],
-            "no_traffic_splits": [],
-            "recently_modified_count": 0,
-            "errors": [error_message],
-        }
+        return _empty_metrics([error_message])
 
 
 def display_split_metrics(metrics):
@@ -163,6 +189,14 @@ def display_split_metrics(metrics):
             console.print(f"[red]- {error}[/]")
         console.print("\n[yellow]Note: Some data may be incomplete due to errors.[/]")
 
+    # Nothing was fetched, skip building empty tables
+    if (
+        metrics["total_splits"] == 0
+        and not metrics["changed_splits"]
+        and not metrics["no_traffic_splits"]
+    ):
+        return
+
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", justify="right")
@@ -172,36 +206,35 @@ def display_split_metrics(metrics):
     table.add_row("Recently Modified (7 days)", str(metrics["recently_modified_count"]))
     table.add_row("Flags with No Traffic", str(len(metrics["no_traffic_splits"])))
 
-    console.print(table)
+    # Sections are collected and printed in one call
+    renderables = [table]
 
     # Environment breakdown
     if metrics["splits_by_environment"]:
-        console.print("\n[bold magenta]Splits by Environment:[/]")
         env_table = Table(show_header=True, header_style="bold magenta")
         env_table.add_column("Environment", style="cyan")
         env_table.add_column("Count", justify="right")
 
         for env, count in metrics["splits_by_environment"].items():
             env_table.add_row(env, str(count))
-        console.print(env_table)
+        renderables += ["\n[bold magenta]Splits by Environment:[/]", env_table]
 
     # Changed splits
     if metrics["changed_splits"]:
-        console.print("\n[bold magenta]Recently Changed Splits:[/]")
-        for split in metrics["changed_splits"]:
-            console.print(
-                Panel.fit(
-                    f"""[cyan]{split['name']}[/]
+        renderables.append("\n[bold magenta]Recently Changed Splits:[/]")
+        renderables.extend(
+            Panel.fit(
+                f"""[cyan]{split['name']}[/]
 Changed at: {split['change_time']}
 Status: {split['status']}
 Treatments: {', '.join(split['treatments'])}""",
-                    border_style="blue",
-                )
+                border_style="blue",
             )
+            for split in metrics["changed_splits"]
+        )
 
     # Display flags with no traffic
     if metrics["no_traffic_splits"]:
-        console.print("\n[bold magenta]Flags with No Traffic:[/]")
         no_traffic_table = Table(show_header=True, header_style="bold magenta")
         no_traffic_table.add_column("Flag Name", style="cyan")
         no_traffic_table.add_column("Status", style="yellow")
@@ -211,4 +244,6 @@ Treatments: {', '.join(split['treatments'])}""",
             no_traffic_table.add_row(
                 split["name"], split["status"], split["last_modified"]
             )
-        console.print(no_traffic_table)
+        renderables += ["\n[bold magenta]Flags with No Traffic:[/]", no_traffic_table]
+
+    console.print(Group(*renderables))
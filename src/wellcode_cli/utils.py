@@ -1,124 +1,223 @@
+import copy
 import json
+import logging
 import os
+import sys
 import tempfile
 from collections import defaultdict
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
-import pandas as pd
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+if orjson is not None:
+    # Metrics objects go through their own to_dict (passthrough dataclass) and
+    # dicts keyed by PR number need non-str key support
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_SERIALIZE_NUMPY
+    )
+
 # Define config file location
 CONFIG_DIR = Path.home() / ".wellcode"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
-
-class WellcodeJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, set):
-            return list(obj)  # Convert sets to lists for JSON serialization
-        if isinstance(obj, defaultdict):
-            return dict(obj)  # Convert defaultdict to regular dict
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
+# Analysis files are named with a sortable UTC timestamp after this prefix
+ANALYSES_DIR = CONFIG_DIR / "analyses"
+ANALYSIS_PREFIX = "wellcode_analysis_"
+
+
+def _json_default(obj):
+    """Convert objects the JSON encoders don't handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)  # Convert sets to lists for JSON serialization
+    if isinstance(obj, defaultdict):
+        return dict(obj)  # Convert defaultdict to regular dict
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    # Only look for pandas objects if something already imported pandas
+    pd = sys.modules.get("pandas")
+    if pd is not None:
         if isinstance(obj, pd.DataFrame):
             return obj.to_dict(orient="records")
         if isinstance(obj, pd.Series):
             return obj.to_dict()
-        if hasattr(obj, "to_dict"):
-            return obj.to_dict()
-        return super().default(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
-def save_analysis_data(metrics_data, analysis_result):
-    """Save metrics and analysis data to a temporary file"""
-    # Convert any defaultdict to regular dict before serialization
-    metrics_data = json.loads(json.dumps(metrics_data, cls=WellcodeJSONEncoder))
+class WellcodeJSONEncoder(json.JSONEncoder):
+    def default(self, obj):
+        return _json_default(obj)
 
+
+def save_analysis_data(metrics_data, analysis_result):
+    """Save metrics and analysis data to a new file in the analyses directory"""
+    # Metrics objects, sets and datetimes are converted while the file is
+    # written, so the metrics are only encoded once
     data = {
         "metrics": metrics_data,
         "analysis": analysis_result,
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
-    temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
+    # The file is read back by get_latest_analysis, so it is written compact
+    # unless debug logging (-vv) asks for something readable
+    pretty = logging.getLogger().isEnabledFor(logging.DEBUG)
 
-    with temp_file:
-        json.dump(data, temp_file, indent=2, cls=WellcodeJSONEncoder)
+    ANALYSES_DIR.mkdir(parents=True, exist_ok=True)
+    file_options = {
+        "prefix": f"{ANALYSIS_PREFIX}{datetime.now(timezone.utc):%Y%m%dT%H%M%S%f}_",
+        "suffix": ".json",
+        "dir": ANALYSES_DIR,
+        "delete": False,
+    }
+
+    if orjson is not None:
+        options = ORJSON_OPTIONS | orjson.OPT_INDENT_2 if pretty else ORJSON_OPTIONS
+        temp_file = tempfile.NamedTemporaryFile(mode="wb", **file_options)
+        with temp_file:
+            temp_file.write(orjson.dumps(data, default=_json_default, option=options))
+    else:
+        temp_file = tempfile.NamedTemporaryFile(mode="w", **file_options)
+        with temp_file:
+            if pretty:
+                json.dump(data, temp_file, indent=2, cls=WellcodeJSONEncoder)
+            else:
+                json.dump(
+                    data, temp_file, separators=(",", ":"), cls=WellcodeJSONEncoder
+                )
 
     return temp_file.name
 
 
-def get_latest_analysis():
-    """Get the most recent analysis data"""
+def _loads(content):
+    """Parse JSON content, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@lru_cache(maxsize=4)
+def _read_analysis(path: str, mtime_ns: int) -> bytes:
+    """Read an analysis file, cached per file modification time"""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _legacy_analysis_path():
+    """Latest analysis saved to the temp directory by older versions"""
+    temp_dir = tempfile.gettempdir()
     try:
-        # Get the temp directory
-        temp_dir = tempfile.gettempdir()
+        candidates = [
+            os.path.join(temp_dir, name)
+            for name in os.listdir(temp_dir)
+            if name.startswith("tmp") and name.endswith(".json")
+        ]
+        return max(candidates, key=os.path.getmtime, default=None)
+    except OSError:
+        return None
 
-        # Find all JSON files in temp directory that match our pattern
-        analysis_files = [f for f in os.listdir(temp_dir) if f.endswith(".json")]
 
-        if not analysis_files:
-            console.print(
-                "[yellow]No previous analysis found. Please run 'analyze' first.[/]"
-            )
-            return None
+def get_latest_analysis():
+    """Get the most recent analysis data"""
+    try:
+        # File names embed their creation time, so the latest analysis is
+        # the greatest name and no stat() calls are needed
+        latest_entry = None
+        latest_name = ""
+        if ANALYSES_DIR.is_dir():
+            with os.scandir(ANALYSES_DIR) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (
+                        name.startswith(ANALYSIS_PREFIX)
+                        and name.endswith(".json")
+                        and name > latest_name
+                    ):
+                        latest_name = name
+                        latest_entry = entry
+
+        if latest_entry is not None:
+            latest_file = latest_entry.path
+            mtime_ns = latest_entry.stat().st_mtime_ns
+        else:
+            # Analyses saved before they moved to ANALYSES_DIR are still found
+            latest_file = _legacy_analysis_path()
+            if latest_file is None:
+                console.print(
+                    "[yellow]No previous analysis found. Please run 'analyze' first.[/]"
+                )
+                return None
+            mtime_ns = os.stat(latest_file).st_mtime_ns
 
-        # Get the most recent file
-        latest_file = max(
-            [os.path.join(temp_dir, f) for f in analysis_files], key=os.path.getmtime
-        )
+        # Read and validate JSON content, reusing the file content while the
+        # file is unchanged. It is parsed on every call so callers get their
+        # own copy of the data
+        try:
+            data = _loads(_read_analysis(latest_file, mtime_ns))
 
-        # Read and validate JSON content
-        with open(latest_file, "r") as f:
-            try:
-                content = f.read()
-                # Try to parse the JSON
-                data = json.loads(content)
-
-                # Validate expected structure
-                if not isinstance(data, dict) or "metrics" not in data:
-                    console.print(
-                        "[yellow]Invalid analysis file format. Please run 'analyze' again.[/]"
-                    )
-                    return None
-
-                return data
-            except json.JSONDecodeError as e:
-                console.print(f"[red]Error reading analysis file: {str(e)}[/]")
+            # Validate expected structure
+            if not isinstance(data, dict) or "metrics" not in data:
                 console.print(
-                    "[yellow]Please run 'analyze' again to generate new data.[/]"
+                    "[yellow]Invalid analysis file format. Please run 'analyze' again.[/]"
                 )
+                return None
 
-                # Optionally, remove the corrupted file
+            return data
+        except json.JSONDecodeError as e:
+            console.print(f"[red]Error reading analysis file: {str(e)}[/]")
+            console.print("[yellow]Please run 'analyze' again to generate new data.[/]")
+
+            # Optionally, remove the corrupted file. Files in the temp
+            # directory may belong to other programs, so leave those alone
+            if latest_entry is not None:
                 try:
                     os.remove(latest_file)
                 except OSError:
                     pass
 
-                return None
-            except Exception as e:
-                console.print(
-                    f"[red]Unexpected error reading analysis file: {str(e)}[/]"
-                )
-                return None
+            return None
+        except Exception as e:
+            console.print(f"[red]Unexpected error reading analysis file: {str(e)}[/]")
+            return None
 
     except Exception as e:
         console.print(f"[red]Error accessing analysis data: {str(e)}[/]")
         return None
 
 
+@lru_cache(maxsize=4)
+def _read_config(path: str, mtime_ns: int) -> dict:
+    """Read and parse the config file, cached per file modification time"""
+    with open(path) as f:
+        return json.load(f)
+
+
 def load_config():
     """Load configuration with validation"""
     config = {}
-    if CONFIG_FILE.exists():
+    try:
+        mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+
+    if mtime_ns is not None:
         try:
-            with open(CONFIG_FILE) as f:
-                config = json.load(f)
+            # Copy so callers can't mutate the cached config
+            config = copy.deepcopy(_read_config(str(CONFIG_FILE), mtime_ns))
         except Exception as e:
             console.print(f"[yellow]Warning: Error reading config file: {e}[/]")
 
@@ -0,0 +1,93 @@
+import asyncio
+import sys
+from types import SimpleNamespace
+
+import pytest
+import wellcode_cli.commands.chat_interface  # noqa: F401
+from rich.console import Console
+
+# The package re-exports the click command under the module's name
+chat_interface = sys.modules["wellcode_cli.commands.chat_interface"]
+
+
+class FakeStream:
+    def __init__(self, text):
+        self.text = text
+        self.current_message_snapshot = SimpleNamespace(
+            usage=SimpleNamespace(cache_read_input_tokens=0)
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self.text.split(" "):
+            yield chunk + " "
+
+
+class FakeClient:
+    """Answers each model with a canned interpretation"""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.models = []
+        self.messages = SimpleNamespace(stream=self.stream)
+
+    def stream(self, model, **kwargs):
+        self.models.append(model)
+        return FakeStream(self.answers[model])
+
+
+@pytest.fixture(autouse=True)
+def quiet_chat(monkeypatch):
+    monkeypatch.setattr(chat_interface, "console", Console(quiet=True))
+    monkeypatch.setattr(chat_interface, "get_interpreter_model", lambda: None)
+    chat_interface._interpretations.clear()
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("review --days 7", True),
+        ("help", True),
+        ("reviewer", False),
+        ("Sure! Here is the command: review", False),
+        ("", False),
+    ],
+)
+def test_is_command(text, expected):
+    assert chat_interface._is_command(text) is expected
+
+
+def test_interpret_retries_with_fallback_model():
+    client = FakeClient(
+        {
+            chat_interface.INTERPRETER_MODEL: "I am not sure what you mean",
+            chat_interface.FALLBACK_INTERPRETER_MODEL: "review --days 7",
+        }
+    )
+
+    result = asyncio.run(chat_interface._interpret(client, "last week please"))
+
+    assert result == "review --days 7"
+    assert client.models == [
+        chat_interface.INTERPRETER_MODEL,
+        chat_interface.FALLBACK_INTERPRETER_MODEL,
+    ]
+
+    # The command is cached, a repeated request doesn't call the API again
+    asyncio.run(chat_interface._interpret(client, "last  week please"))
+    assert len(client.models) == 2
+
+
+def test_interpret_keeps_small_model_answer():
+    client = FakeClient({chat_interface.INTERPRETER_MODEL: "report --days 30"})
+
+    result = asyncio.run(chat_interface._interpret(client, "monthly report"))
+
+    assert result == "report --days 30"
+    assert client.models == [chat_interface.INTERPRETER_MODEL]
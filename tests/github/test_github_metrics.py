@@ -1,4 +1,13 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from wellcode_cli.github.github_metrics import (
+    get_pulls_in_range,
+    update_bottleneck_metrics,
+    update_review_metrics,
+)
 from wellcode_cli.github.models.metrics import OrganizationMetrics
+from wellcode_cli.github.utils import ensure_datetime
 
 
 def test_github_metrics_initialization():
@@ -9,3 +18,97 @@ def test_github_metrics_initialization():
     assert metrics.repositories == {}
     assert metrics.teams == {}
     assert metrics.users == {}
+
+
+def test_github_metrics_to_dict():
+    """Test that to_dict converts nested metrics, sets and datetimes."""
+    metrics = OrganizationMetrics(name="test")
+    repo = metrics.get_or_create_repository("repo")
+    repo.contributors.add("alice")
+    repo.review_metrics.reviewers_per_pr[1].add("bob")
+    repo.update_timestamp(datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    result = metrics.to_dict()["repositories"]["repo"]
+
+    assert result["contributors"] == ["alice"]
+    assert result["review_metrics"]["reviewers_per_pr"] == {1: ["bob"]}
+    assert result["last_updated"] == "2024-01-01T00:00:00+00:00"
+
+
+def test_get_pulls_in_range_stops_at_start_date():
+    """Test that PR paging stops at the first PR created before the range."""
+    end = datetime(2024, 1, 31, tzinfo=timezone.utc)
+    listed = []
+
+    def get_pulls(**kwargs):
+        for number in range(100):
+            listed.append(number)
+            yield SimpleNamespace(
+                number=number, created_at=end - timedelta(days=number)
+            )
+
+    repo = SimpleNamespace(get_pulls=get_pulls)
+    pulls = get_pulls_in_range(repo, end - timedelta(days=5), end - timedelta(days=2))
+
+    assert [pr.number for pr in pulls] == [2, 3, 4, 5]
+    assert len(listed) == 7
+
+
+def test_update_review_metrics_records_one_wait_time_per_pr():
+    """Test that the first-review wait time is recorded once per PR."""
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    pr = SimpleNamespace(
+        number=1,
+        user=SimpleNamespace(login="alice"),
+        created_at=created,
+        merged=False,
+    )
+    reviews = [
+        SimpleNamespace(
+            user=SimpleNamespace(login=login),
+            submitted_at=created + timedelta(hours=hours),
+            state="APPROVED",
+            body="",
+        )
+        for login, hours in (("bob", 1), ("carol", 2), ("dave", 3))
+    ]
+    metrics = OrganizationMetrics(name="test")
+    repo = metrics.get_or_create_repository("repo")
+    pr_data = {"reviews": reviews, "review_comments": [], "issue_comments": []}
+
+    update_review_metrics(pr, pr_data, repo, metrics)
+
+    assert metrics.bottleneck_metrics.review_wait_times == [60.0]
+    assert repo.bottleneck_metrics.review_wait_times == [60.0]
+
+
+def test_update_bottleneck_metrics_ages_open_prs_from_one_time():
+    """Test that open PRs are aged from the given time and blocked by label."""
+    now = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    pr = SimpleNamespace(
+        number=1,
+        user=SimpleNamespace(login="alice"),
+        created_at=now - timedelta(days=10),
+        merged_at=None,
+    )
+    metrics = OrganizationMetrics(name="test")
+    repo = metrics.get_or_create_repository("repo")
+
+    update_bottleneck_metrics(pr, {"blocked"}, repo, metrics, now)
+
+    for bottleneck in (repo.bottleneck_metrics, metrics.bottleneck_metrics):
+        assert bottleneck.stale_prs == 1
+        assert bottleneck.long_running_prs == 0
+        assert bottleneck.blocked_prs == 1
+        assert bottleneck.bottleneck_users == {"alice": 1}
+        assert bottleneck.review_wait_times == []
+
+
+def test_ensure_datetime_keeps_each_time_zone():
+    """Test that equal instants in different time zones keep their own zone."""
+    utc = datetime(2024, 1, 5, 23, tzinfo=timezone.utc)
+    tokyo = utc.astimezone(timezone(timedelta(hours=9)))
+
+    assert ensure_datetime(utc).hour == 23
+    assert ensure_datetime(tokyo).hour == 8
+    assert ensure_datetime(datetime(2024, 1, 1)).tzinfo is timezone.utc
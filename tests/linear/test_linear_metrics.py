@@ -0,0 +1,26 @@
+from wellcode_cli.linear.models.metrics import LinearOrgMetrics, TeamMetrics
+
+
+def test_aggregate_metrics_with_projects_missing_timings():
+    """Test that aggregate_metrics tolerates projects without timing data."""
+    metrics = LinearOrgMetrics(name="test")
+    team = TeamMetrics(name="core")
+    team.update_from_issue(
+        {
+            "state": {"type": "completed"},
+            "labels": {"nodes": [{"name": "Bug"}]},
+            "assignee": {"name": "alice"},
+            "project": {"key": "PRJ"},
+        }
+    )
+    metrics.teams["core"] = team
+
+    metrics.aggregate_metrics()
+
+    assert team.avg_cycle_time == 0
+    assert team.estimation_accuracy == 0
+    assert team.projects["PRJ"] == {
+        "total_issues": 1,
+        "completed_issues": 1,
+        "bugs": 1,
+    }